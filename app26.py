@@ -1,13 +1,23 @@
 import streamlit as st
 import pandas as pd
-from pyvis.network import Network
-import tempfile
-import os
-import random
-import base64
-import math
 import streamlit.components.v1 as components
-import urllib.parse
+import math
+from assets import get_asset_bundle, link_assets
+from file_server import get_file_server
+from locus_index import live_locus_index
+from metrics import RerunTrace, debug_enabled, debug_panel
+from node_store import get_node_store
+from graph_builder import (create_network, create_cluster_network, build_base_graph, compute_force_layout,
+                           force_layout_key, force_layout_ready, UNCLASSIFIED)
+from layout_engine import get_layout_jobs
+from network_component import network_view
+from node_analytics import live_node_analytics
+from node_detail import page_urls
+from palette import get_palette
+from prefetch import get_prefetcher
+from region_query import get_region_query
+from render_cache import get_render_cache, render_key
+from search_index import get_search_index
 
 # --- Page setup ---
 st.set_page_config(page_title="Interactive Network", layout="wide")
@@ -74,126 +84,140 @@ if 'initialized' not in st.session_state:
     st.session_state.connection_width = 2
     st.session_state.selected_classes = []
     st.session_state.bg_color = "#ffffff"
-    st.session_state.node_colors = {}
+    st.session_state.picked_nodes = []
 
-# --- Load Data ---
-@st.cache_data
-def load_data():
-    local_file_path = "file.txt"
-    if os.path.exists(local_file_path):
-        return pd.read_csv(local_file_path, sep="\t")
-    else:
-        st.error("Local file `file.txt` not found.")
-        return None
+trace = RerunTrace("network")
 
-df = load_data()
+# --- Load Data ---
+with trace.span("load_data"):
+    store = get_node_store()
+df = store.edges
+if df is None:
+    st.error("Local file `file.txt` not found.")
 if df is None or not {"source", "target"}.issubset(df.columns):
     st.error("File must contain 'source' and 'target' columns.")
     st.stop()
+if st.session_state.get("data_version", store.version) != store.version:
+    st.toast("Data files changed on disk; the network has been updated.")
+st.session_state.data_version = store.version
 
-# --- Helper: Rotifer image fallback ---
-def get_rotifera_image_base64():
-    try:
-        with open("150px-Rotifer-1.jpg", "rb") as img:
-            return f"data:image/jpeg;base64,{base64.b64encode(img.read()).decode()}"
-    except:
-        svg = """
-        <svg width="100" height="100" xmlns="http://www.w3.org/2000/svg">
-            <circle cx="50" cy="50" r="40" fill="#ff6b6b" stroke="#333" stroke-width="2"/>
-            <text x="50" y="55" text-anchor="middle" fill="white" font-size="14" font-weight="bold">R</text>
-        </svg>
-        """
-        return "data:image/svg+xml;base64," + base64.b64encode(svg.encode()).decode()
-
-rotifer_img = get_rotifera_image_base64()
+# --- Shared assets ---
+# The hub image and the vis/pyvis scripts are served by Streamlit itself
+# under content-hashed URLs; renders only reference them
+assets = get_asset_bundle()
+rotifer_img = assets.hub_image
 
 # --- Sidebar Controls ---
+LOD_THRESHOLD = 2000
+SEARCH_LIMIT = 200
+PANEL_PAGE_SIZE = 50
 st.sidebar.header("Visualization Controls")
 st.session_state.image_size = st.sidebar.slider("Node Size", 20, 100, st.session_state.image_size)
 st.session_state.font_size = st.sidebar.slider("Font Size", 8, 40, st.session_state.font_size)
 st.session_state.connection_width = st.sidebar.slider("Connection Width", 1, 10, st.session_state.connection_width)
 st.session_state.bg_color = st.sidebar.color_picker("Background Color", st.session_state.bg_color)
+incremental = st.sidebar.checkbox(
+    "Incremental graph updates", value=False,
+    help="Load the graph into the browser once and send only highlight, style and filter changes "
+         "(full graph mode only)."
+)
 
 # Class filter
+class_counts = store.class_index.counts() if store.class_index is not None else pd.Series(dtype=int)
+class_names = class_counts.index[class_counts.to_numpy() > 0].tolist()
 if "class" in df.columns:
     st.sidebar.subheader("Filter by Class")
     selected_classes = []
-    for c in sorted(df["class"].dropna().unique()):
+    for c in class_names:
         if st.sidebar.checkbox(c, c in st.session_state.selected_classes, key=f"class_{c}"):
             selected_classes.append(c)
     st.session_state.selected_classes = selected_classes
 
-# Node multi-select for info panel
+# Level of detail: large tables start collapsed into one node per class
+st.sidebar.subheader("Level of Detail")
+render_mode = st.sidebar.radio(
+    "Rendering mode", ["Full graph", "Clustered by class"],
+    index=1 if len(store.sorted_nodes) > LOD_THRESHOLD else 0
+)
+clustered = render_mode == "Clustered by class"
+color_choice = st.sidebar.radio("Node colours", ["By node", "By class"], horizontal=True)
+color_scheme = "class" if color_choice == "By class" else "node"
+with trace.span("palette"):
+    palette = get_palette(color_scheme)
+layout = "ring"
+if not clustered:
+    layout_choice = st.sidebar.radio(
+        "Layout", ["Hub rings", "Force-directed"],
+        help="Force-directed positions are computed in the background on the server, grouped by class, "
+             "and cached on disk per data file and class filter; hub rings are shown until they are "
+             "ready. Run precompute_layouts.py to build them before the app starts."
+    )
+    layout = "force" if layout_choice == "Force-directed" else "ring"
+
+
+@st.fragment(run_every=2)
+def wait_for_layout(content_hash, layout_classes):
+    # Polls until the background layout is on disk, then reruns the whole page
+    if force_layout_ready(content_hash, layout_classes):
+        st.rerun()
+
+
+if layout == "force":
+    # A force layout that is not on disk yet is computed in the background;
+    # the rings stand in until it is ready, so the page never waits for it
+    layout_classes = () if incremental else tuple(st.session_state.selected_classes)
+    if not force_layout_ready(store.content_hash, layout_classes):
+        get_layout_jobs().submit(force_layout_key(store.content_hash, layout_classes), compute_force_layout,
+                                 df, store.content_hash, layout_classes, store.class_index)
+        layout = "ring"
+        st.info("Computing the force-directed layout in the background; showing hub rings until it is ready.")
+        wait_for_layout(store.content_hash, layout_classes)
+expanded_classes = []
+node_limit = 500
+if clustered:
+    cluster_names = class_names + ([UNCLASSIFIED] if "class" not in df.columns or df["class"].isna().any() else [])
+    expanded_classes = st.sidebar.multiselect("Expand classes", cluster_names)
+    node_limit = st.sidebar.number_input("Max nodes per view", min_value=50, max_value=20000, value=500, step=50)
+
+# Node search and multi-select for info panel
 st.sidebar.subheader("Select Node(s) for Info Panel")
-selected_nodes = st.sidebar.multiselect("Nodes", sorted(df["source"].unique()))
+query = st.sidebar.text_input("Search nodes", placeholder="ID, class, description or protein")
+search_hits = []
+if query.strip():
+    with trace.span("search"):
+        result = get_search_index().search(query, k=SEARCH_LIMIT, classes=st.session_state.selected_classes)
+    search_hits = result.nodes
+    if result.total:
+        facets = " · ".join(f"{c} ({n})" for c, n in sorted(result.facets.items(), key=lambda kv: -kv[1]))
+        st.sidebar.caption(f"{result.total} matches, top {len(search_hits)} listed: {facets}")
+    else:
+        st.sidebar.caption("No matches.")
+    listed = search_hits
+else:
+    # No query: the first nodes in sort order, never the whole table
+    listed = store.sorted_nodes[:SEARCH_LIMIT]
+    if len(store.sorted_nodes) > SEARCH_LIMIT:
+        st.sidebar.caption(f"First {SEARCH_LIMIT} of {len(store.sorted_nodes):,} nodes listed; search to find others.")
+# Keep current picks selectable whatever the list shows
+node_options = list(dict.fromkeys(listed + st.session_state.picked_nodes))
+# Other options (new query, class filter, reloaded data) make a new widget;
+# carry the picks over to it
+if st.session_state.get("node_options") != tuple(node_options):
+    st.session_state.node_options = tuple(node_options)
+    st.session_state.node_select = st.session_state.picked_nodes
+selected_nodes = st.sidebar.multiselect("Nodes", node_options, key="node_select")
+st.session_state.picked_nodes = selected_nodes
+if selected_nodes:
+    # Warm the detail and genome pages for the first page of picks in the background
+    get_prefetcher().prefetch(store, selected_nodes[:PANEL_PAGE_SIZE], live_locus_index(),
+                              live_node_analytics(), get_region_query())
+highlight_matches = bool(search_hits) and st.sidebar.checkbox("Highlight search matches in graph", value=False)
+highlight_nodes = list(dict.fromkeys(selected_nodes + (search_hits if highlight_matches else [])))
 
 # Sidebar toggle for right info panel
 show_info = st.sidebar.checkbox("Show Node Info Panel", value=True)
-
-# --- Helpers ---
-def random_color():
-    return "#" + ''.join(random.choices("0123456789ABCDEF", k=6))
-
-def create_network(df, image_size, font_size, connection_width, selected_classes, bg_color, highlight_nodes):
-    target_node = df["target"].value_counts().index[0]
-    net = Network(height="750px", width="100%", bgcolor=bg_color, font_color="black", notebook=False)
-
-    # Add target (center) node
-    net.add_node(
-        target_node, label="", shape="image", image=rotifer_img, size=image_size,
-        color={"background":"#ffffff","border":"#ffffff"},
-        font={"size":font_size,"color":"#000000"}, physics=False
-    )
-
-    filtered_df = df.copy()
-    if "class" in df.columns and selected_classes:
-        filtered_df = filtered_df[filtered_df["class"].isin(selected_classes)]
-
-    # Persistent colors
-    for node in filtered_df["source"].unique():
-        if node not in st.session_state.node_colors:
-            st.session_state.node_colors[node] = random_color()
-
-    sources = filtered_df["source"].unique()
-    n_sources = len(sources)
-    radius = 400 + n_sources * 2
-
-    for i, node in enumerate(sources):
-        angle = 2 * math.pi * (i / n_sources)
-        x, y = radius * math.cos(angle), radius * math.sin(angle)
-        row = filtered_df[filtered_df["source"] == node].iloc[0]
-        color = st.session_state.node_colors[node]
-        font_color = "#000000" if int(color[1:],16) > 0x888888 else "#ffffff"
-        border_width = 4 if node in highlight_nodes else 2
-        title_text = "".join(f"{col}: {row[col]}\n" for col in df.columns)
-
-        net.add_node(
-            node, label=node, shape="box", size=image_size,
-            font={"size":font_size,"color":font_color},
-            color=color, borderWidth=border_width,
-            title=title_text,
-            x=x, y=y, physics=False
-        )
-
-        edge_color = "#FFD700" if node in highlight_nodes else "#7f8c8d"
-        edge_width = connection_width*2 if node in highlight_nodes else connection_width
-        net.add_edge(node, target_node, color=edge_color, width=edge_width)
-
-    net.set_options(f"""
-    {{
-      "nodes": {{
-        "font": {{ "size": {font_size}, "face": "Arial" }},
-        "shapeProperties": {{ "borderRadius": 2 }}
-      }},
-      "edges": {{
-        "smooth": {{ "enabled": true, "type": "curvedCW" }},
-        "width": {connection_width}
-      }},
-      "physics": {{ "enabled": false }},
-      "interaction": {{ "hover": true }}
-    }}
-    """)
-    return net
+st.sidebar.checkbox("Show performance panel", key="show_debug",
+                    help="Stage timings for this run, cache hit rates and file server traffic.")
 
 # --- Layout ---
 if show_info:
@@ -203,14 +227,60 @@ else:
 
 # Graph
 with col_graph:
-    net = create_network(df, st.session_state.image_size, st.session_state.font_size,
+    if incremental and not clustered:
+        selected = set(st.session_state.selected_classes)
+        # Rows without a class only show unfiltered, as in the full render
+        hidden_classes = [c for c in class_names + [UNCLASSIFIED] if c not in selected] if selected else []
+        graph_version = f"{store.version}|{color_scheme}|{layout}"
+
+        def base_graph():
+            with trace.span("build_base_graph"):
+                return build_base_graph(df, palette, rotifer_img, graph_version,
+                                        layout=layout,
+                                        content_hash=store.content_hash if layout == "force" else "")
+
+        with trace.span("network_component"):
+            network_view(
+                graph_version, base_graph,
+                highlight_nodes, st.session_state.image_size, st.session_state.font_size,
+                st.session_state.connection_width, st.session_state.bg_color, hidden_classes,
+            )
+    else:
+        key = render_key(store.version, st.session_state.image_size, st.session_state.font_size,
                          st.session_state.connection_width, st.session_state.selected_classes,
-                         st.session_state.bg_color, highlight_nodes=set(selected_nodes))
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".html") as tmp:
-        net.save_graph(tmp.name)
-        html_content = open(tmp.name, "r", encoding="utf-8").read()
-        os.unlink(tmp.name)
-    components.html(html_content, height=750, scrolling=False)
+                         st.session_state.bg_color, highlight_nodes, color_scheme,
+                         render_mode, frozenset(expanded_classes), node_limit, layout)
+
+        def render():
+            # Only called on a render cache miss
+            trace.count("renders")
+            with trace.span("create_network"):
+                net = build_network()
+            # Rendered in memory; no temp file round trip
+            with trace.span("generate_html"):
+                return link_assets(net.generate_html(), assets)
+
+        def build_network():
+            if clustered:
+                return create_cluster_network(df, st.session_state.image_size, st.session_state.font_size,
+                                              st.session_state.connection_width, st.session_state.selected_classes,
+                                              st.session_state.bg_color, highlight_nodes=set(highlight_nodes),
+                                              node_colors=palette, hub_image=rotifer_img,
+                                              expanded_classes=expanded_classes, node_limit=node_limit,
+                                              class_index=store.class_index)
+            else:
+                return create_network(df, st.session_state.image_size, st.session_state.font_size,
+                                      st.session_state.connection_width, st.session_state.selected_classes,
+                                      st.session_state.bg_color, highlight_nodes=set(highlight_nodes),
+                                      node_colors=palette, hub_image=rotifer_img,
+                                      layout=layout, content_hash=store.content_hash if layout == "force" else "",
+                                      class_index=store.class_index)
+
+        with trace.span("render"):
+            html_content = get_render_cache().get_or_render(key, render)
+        trace.count("payload_bytes", len(html_content.encode("utf-8")))
+        with trace.span("components_html"):
+            components.html(html_content, height=750, scrolling=False)
 
 # Info panel
 if show_info:
@@ -218,40 +288,29 @@ if show_info:
         st.subheader("Selected Node Information")
         info_container = st.container(height=750)
 
-        with info_container:
+        with info_container, trace.span("info_panel"):
             if selected_nodes:
-                for i, node in enumerate(selected_nodes):
-                    if node in df['source'].values:
-                        row = df[df['source'] == node].iloc[0]
-                        st.markdown(f"**📌 {row['source']}**")
-
-                        # ✅ Detail Page Link
-                        encoded_node = urllib.parse.quote(node)
-                        node_detail_url = f"/Node_Details?node={encoded_node}"
-                        base_url = f"http://localhost:{st.get_option('server.port') or 8501}"
-                        full_url = base_url + node_detail_url
-
-                        st.markdown(
-                            f'<a href="{full_url}" target="_blank" class="external-link">📋 Open Detail Page</a>',
-                            unsafe_allow_html=True
-                        )
-
-                        # ✅ NEW: IGV Browser Link
-                        igv_url = f"/IGV_Browser?node={encoded_node}"
-                        full_igv_url = base_url + igv_url
-                        st.markdown(
-                            f'<a href="{full_igv_url}" target="_blank" class="igv-link">🧬 Open Genome Browser</a>',
-                            unsafe_allow_html=True
-                        )
-
-                        info_data = [
-                            {"Property": col.capitalize(), "Value": row[col]}
-                            for col in df.columns if col != "source"
-                        ]
-                        st.dataframe(pd.DataFrame(info_data), hide_index=True, use_container_width=True)
-
-                        if i < len(selected_nodes) - 1:
-                            st.divider()
+                # One table for the visible page only, so payload and render time
+                # follow the page size rather than the selection size
+                n_pages = math.ceil(len(selected_nodes) / PANEL_PAGE_SIZE)
+                page = 1
+                if n_pages > 1:
+                    page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1)
+                    st.caption(f"{len(selected_nodes)} nodes selected")
+                visible = selected_nodes[(page - 1) * PANEL_PAGE_SIZE:page * PANEL_PAGE_SIZE]
+                rows = store.node_rows(visible)
+                base_url = f"http://localhost:{st.get_option('server.port') or 8501}"
+                info_df = rows.reset_index(drop=True)
+                info_df.insert(1, "Details", page_urls(info_df["source"], base_url, "Node_Details"))
+                info_df.insert(2, "Genome", page_urls(info_df["source"], base_url, "IGV_Browser"))
+                info_df.columns = [c if c in ("Details", "Genome") else c.capitalize() for c in info_df.columns]
+                st.dataframe(
+                    info_df, hide_index=True, use_container_width=True, height=680,
+                    column_config={
+                        "Details": st.column_config.LinkColumn("Details", display_text="📋 Open"),
+                        "Genome": st.column_config.LinkColumn("Genome", display_text="🧬 IGV"),
+                    },
+                )
             else:
                 st.info("Select one or more nodes from the sidebar to see their details here.")
 
@@ -259,14 +318,15 @@ if show_info:
 with st.expander("ℹ️ How to use this application"):
     st.markdown("""
     **Interactive Network Graph Features:**
-    1. Select nodes from the sidebar to view information.
-    2. Click "Open Detail Page" to open node details in a new tab.
-    3. Click "Open Genome Browser" to view genomic information in IGV browser.
+    1. Search for nodes in the sidebar and select them to view information.
+    2. Click "📋 Open" in the Details column to open a node's detail page in a new tab.
+    3. Click "🧬 IGV" in the Genome column to view genomic information in the IGV browser.
     4. Filter nodes by class using the sidebar.
     5. Customize visuals with sidebar sliders.
 
     **New Features:**
-    - **Genome Browser**: Click the 🧬 button to open the IGV genome browser for selected genes
+    - **Genome Browser**: Click "🧬 IGV" in the info panel to open the IGV genome browser for selected genes
+    - **Paging**: Large selections are split into pages of the info panel table
     - **Auto-navigation**: The genome browser automatically shows the genomic region for selected genes
     - **Full Integration**: Seamlessly switch between network view, detail pages, and genomic data
     """)
@@ -281,3 +341,7 @@ st.markdown(
     """,
     unsafe_allow_html=True
 )
+
+trace.finish()
+if debug_enabled():
+    debug_panel(trace, get_file_server().metrics_url)
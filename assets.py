@@ -0,0 +1,98 @@
+import base64
+import hashlib
+import os
+import re
+import streamlit as st
+import streamlit.components.v1 as components
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+LIB_DIR = os.path.join(ROOT_DIR, "lib")
+# Logical name -> file under LIB_DIR
+ASSET_FILES = {
+    "hub_image": "images/150px-Rotifer-1.jpg",
+    "vis_js": "vis-9.1.2/vis-network.min.js",
+    "vis_css": "vis-9.1.2/vis-network.css",
+    "tom_select_js": "tom-select/tom-select.complete.min.js",
+    "tom_select_css": "tom-select/tom-select.css",
+    "pyvis_utils_js": "bindings/utils.js",
+    "igv_js": "igv/igv.min.js",
+}
+IGV_CDN = "https://cdn.jsdelivr.net/npm/igv@2.15.7/dist/igv.min.js"
+# References in pyvis' generated page -> the asset that replaces them
+PYVIS_RESOURCES = {
+    "lib/bindings/utils.js": "pyvis_utils_js",
+    "https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/vis-network.min.js": "vis_js",
+    "https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/dist/vis-network.min.css": "vis_css",
+    "lib/tom-select/tom-select.complete.min.js": "tom_select_js",
+    "lib/tom-select/tom-select.css": "tom_select_css",
+}
+_TAG_RE = re.compile(r'<(script|link)\b[^>]*?\b(?:src|href)="([^"]+)"[^>]*>')
+FALLBACK_HUB_SVG = """
+<svg width="100" height="100" xmlns="http://www.w3.org/2000/svg">
+    <circle cx="50" cy="50" r="40" fill="#ff6b6b" stroke="#333" stroke-width="2"/>
+    <text x="50" y="55" text-anchor="middle" fill="white" font-size="14" font-weight="bold">R</text>
+</svg>
+"""
+
+# Never rendered: declaring it makes Streamlit serve lib/ at
+# /component/<name>/..., on the same host and port as the app itself, with
+# proper JS/CSS types (st.static only serves images). Unlike the file
+# server's random localhost port, this is reachable wherever the app is.
+# Streamlit sends "Cache-Control: public" with no max-age and an ETag, so
+# browsers revalidate (a 304, no body) instead of caching for good.
+_lib_component = components.declare_component("lib", path=LIB_DIR)
+
+
+def lib_url_prefix():
+    base_path = (st.get_option("server.baseUrlPath") or "").strip("/")
+    return (f"/{base_path}" if base_path else "") + f"/component/{_lib_component.name}/"
+
+
+# --- Content-hashed assets ---
+class AssetBundle:
+    """Files under lib/ at same-origin URLs carrying their content hash, e.g.
+    /component/assets.lib/vis-9.1.2/vis-network.min.js?v=3f2a9c1e04b7.
+
+    The query changes whenever the file does, so a cached copy is never
+    stale; files missing on disk simply have no URL. Renders reference the
+    hub image by URL too, with an inline SVG when it is missing.
+    """
+
+    def __init__(self, lib_dir=LIB_DIR, files=ASSET_FILES, prefix=None):
+        prefix = lib_url_prefix() if prefix is None else prefix
+        self.paths = {}
+        for name, rel in files.items():
+            path = os.path.join(lib_dir, rel)
+            if not os.path.isfile(path):
+                continue
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:12]
+            self.paths[name] = f"{prefix}{rel}?v={digest}"
+        self.hub_image = self.url("hub_image") or \
+            "data:image/svg+xml;base64," + base64.b64encode(FALLBACK_HUB_SVG.encode()).decode()
+
+    def __contains__(self, name):
+        return name in self.paths
+
+    def url(self, name):
+        return self.paths.get(name)
+
+
+def link_assets(html, bundle):
+    # Point pyvis' CDN and relative lib/ tags at the local copies; tags
+    # without a local copy are left as they are
+    def replace(match):
+        tag, ref = match.groups()
+        url = bundle.url(PYVIS_RESOURCES.get(ref, ""))
+        if url is None:
+            return match.group(0)
+        if tag == "script":
+            return f'<script src="{url}">'
+        return f'<link rel="stylesheet" href="{url}">'
+
+    return _TAG_RE.sub(replace, html)
+
+
+@st.cache_resource(show_spinner=False)
+def get_asset_bundle():
+    return AssetBundle()
@@ -0,0 +1,191 @@
+"""Benchmarks for the graph build, render and lookup hot paths.
+
+    python benchmark.py --nodes 10000 100000 1000000 [--out benchmark.json]
+
+Each size gets a synthetic file.txt / vaga_proteins.tsv pair in a scratch
+directory. Every step is timed (best of --repeat runs) and then run once more
+under tracemalloc for its peak Python allocation. tracemalloc only sees
+memory allocated through Python's allocators: Arrow buffers (the ingested
+store and table caches behind load_data) and most NumPy/pandas internals
+outside it are not counted, so peak_bytes understates those steps. Force
+layouts go to a fresh directory on every run and are timed cold. Results are
+written as JSON so runs from different commits can be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from graph_builder import create_network
+from ingest import read_ingested
+from locus_index import LocusIndex
+from node_analytics import NodeAnalytics
+from node_detail import node_detail, node_locus
+from node_store import EDGE_CATEGORICAL, NodeStore, data_version, file_digest, prepare_gene_table
+from palette import NodePalette
+from table_cache import read_table
+
+HUB = "Adineta vaga"
+SAMPLE_NODES = 1000
+CLASS_NAMES = ["Bacteria", "Fungi", "Virus", "Archaea", "Plant", "Animal"]
+WORDS = np.array("cell wall degradation enzyme from soil bacteria antibiotic resistance gene "
+                 "actinobacteria glycoside hydrolase transporter putative protein family domain "
+                 "oxidoreductase kinase membrane secreted binding".split(), dtype=object)
+
+
+# --- Synthetic tables ---
+def class_names(n_classes):
+    return CLASS_NAMES[:n_classes] + [f"Class{i}" for i in range(len(CLASS_NAMES), n_classes)]
+
+
+def synthetic_edges(n_nodes, n_classes=6, description_words=8, extra_hubs=0.05, seed=0):
+    # One edge per node to the hub, plus a few nodes linked to a second target
+    rng = np.random.default_rng(seed)
+    nodes = np.char.add("I4U23_", np.char.zfill(np.arange(n_nodes).astype(str), 6)).astype(object)
+    classes = np.array(class_names(n_classes), dtype=object)[rng.integers(0, n_classes, n_nodes)]
+    words = WORDS[rng.integers(0, len(WORDS), (n_nodes, description_words))]
+    descriptions = [" ".join(row) for row in words.tolist()]
+    edges = pd.DataFrame({"source": nodes, "target": HUB, "class": classes, "description": descriptions})
+    extra = rng.random(n_nodes) < extra_hubs
+    if extra.any():
+        second = edges[extra].assign(target="Adineta ricciae")
+        edges = pd.concat([edges, second], ignore_index=True)
+    return edges
+
+
+def synthetic_genes(nodes, n_chroms=20, seed=0):
+    # Protein table rows for every node, laid out along a few chromosomes
+    rng = np.random.default_rng(seed)
+    nodes = pd.unique(pd.Series(nodes, dtype=object))
+    n = len(nodes)
+    chroms = rng.integers(0, n_chroms, n)
+    begins = np.zeros(n, dtype=np.int64)
+    for c in range(n_chroms):
+        mask = chroms == c
+        begins[mask] = np.cumsum(rng.integers(500, 5000, mask.sum()))
+    return pd.DataFrame({
+        "#Name": "Adineta vaga", "Accession": np.char.add(np.char.add("CP0754", np.char.zfill(chroms.astype(str), 2)), ".1"),
+        "Begin": begins, "End": begins + rng.integers(300, 3000, n), "Strand": np.where(rng.random(n) < 0.5, "+", "-"),
+        "GeneID": np.arange(n), "Locus": "-", "Locus tag": nodes, "Protein product": [f"XP_{i:09d}.1" for i in range(n)],
+        "Length": rng.integers(100, 1000, n), "Protein name": "hypothetical protein",
+    })
+
+
+def write_dataset(out_dir, n_nodes, n_classes, description_words, seed=0):
+    edges = synthetic_edges(n_nodes, n_classes, description_words, seed=seed)
+    edges_path = os.path.join(out_dir, "file.txt")
+    genes_path = os.path.join(out_dir, "vaga_proteins.tsv")
+    edges.to_csv(edges_path, sep="\t", index=False)
+    synthetic_genes(edges["source"], seed=seed).to_csv(genes_path, sep="\t", index=False)
+    return edges_path, genes_path
+
+
+# --- Measurement ---
+def measure(fn, repeat=3):
+    # Best wall time over `repeat` runs, then one traced run for peak memory
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, {"seconds": min(times), "mean_seconds": sum(times) / len(times), "peak_bytes": peak}
+
+
+def run_size(n_nodes, n_classes=6, description_words=8, repeat=3, layout="ring", seed=0):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        edges_path, genes_path = write_dataset(tmp, n_nodes, n_classes, description_words, seed)
+        cache_dir = os.path.join(tmp, "cache")
+        # Caches are built once up front; load_data times the warm start the app sees
+        read_ingested(edges_path, categorical=EDGE_CATEGORICAL, cache_dir=cache_dir)
+        read_table(genes_path, prepare_gene_table, cache_dir)
+
+        # NodeStore hashes the app's own file.txt; the synthetic file's digest is passed in
+        content_hash = file_digest(edges_path)
+
+        def load_data():
+            table = read_ingested(edges_path, categorical=EDGE_CATEGORICAL, cache_dir=cache_dir)
+            return NodeStore(table.edges, read_table(genes_path, prepare_gene_table, cache_dir), data_version(edges_path, genes_path),
+                             table.node_index, table.class_stats, content_hash)
+
+        store, results["load_data"] = measure(load_data, repeat)
+        palette = NodePalette.build(store.edges)
+
+        def build_network():
+            # A new layout directory under the scratch dir per run, never the repo's .cache
+            return create_network(store.edges, 50, 14, 2, [], "#ffffff", highlight_nodes=set(),
+                                  node_colors=palette, hub_image="", layout=layout,
+                                  content_hash=store.content_hash if layout == "force" else "",
+                                  class_index=store.class_index, layout_dir=tempfile.mkdtemp(dir=tmp))
+
+        net, results["create_network"] = measure(build_network, repeat)
+        html_path = os.path.join(tmp, "graph.html")
+        _, results["save_graph"] = measure(lambda: net.save_graph(html_path), repeat)
+        results["save_graph"]["html_bytes"] = os.path.getsize(html_path)
+
+        locus_index, results["locus_index_build"] = measure(
+            lambda: LocusIndex.build(store.edges, store.genes, store.version), repeat)
+        analytics, results["analytics_build"] = measure(
+            lambda: NodeAnalytics.build(store.edges, store.genes, store.version, locus_index), repeat)
+        rng = np.random.default_rng(seed)
+        nodes = store.sorted_nodes
+        sample = [nodes[i] for i in rng.integers(0, len(nodes), min(SAMPLE_NODES, len(nodes)))]
+        # Per-call figures for the page lookups, over a fixed sample of nodes
+        for name, lookup in (("node_lookup", lambda node: node_detail(store, node, locus_index)),
+                             ("locus_resolution", lambda node: node_locus(store, node, locus_index)),
+                             ("analytics_lookup", analytics.node_summary)):
+            _, stats = measure(lambda: [lookup(node) for node in sample], repeat)
+            stats["calls"] = len(sample)
+            stats["seconds_per_call"] = stats["seconds"] / max(len(sample), 1)
+            results[name] = stats
+    return {"nodes": n_nodes, "edges": len(store.edges), "classes": n_classes,
+            "description_words": description_words, "layout": layout, "steps": results}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "-C", os.path.dirname(os.path.abspath(__file__)), "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the HGT network hot paths on synthetic data.")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10_000], help="node counts to run (default: 10000)")
+    parser.add_argument("--classes", type=int, default=len(CLASS_NAMES), help="number of distinct classes")
+    parser.add_argument("--description-words", type=int, default=8, help="words per description")
+    parser.add_argument("--layout", choices=["ring", "force"], default="ring")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per step (best is reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="benchmark.json", help="JSON results file (default: benchmark.json)")
+    args = parser.parse_args(argv)
+
+    runs = []
+    for n_nodes in args.nodes:
+        run = run_size(n_nodes, args.classes, args.description_words, args.repeat, args.layout, args.seed)
+        runs.append(run)
+        for step, stats in run["steps"].items():
+            print(f"{n_nodes:>10,} nodes  {step:<18} {stats['seconds']:9.4f}s  "
+                  f"peak {stats['peak_bytes'] / 2**20:8.1f} MiB")
+    report = {"commit": git_commit(), "python": sys.version.split()[0], "platform": platform.platform(),
+              "pandas": pd.__version__, "numpy": np.__version__, "runs": runs}
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Static export: pre-render the network, node details and IGV sessions.
+
+    python export_site.py --out site [--classes Bacteria Fungi] [--with-data]
+
+The bundle is plain files (graph.json.gz, nodes/*.json, igv/*.json, lib/)
+that any static host or CDN can serve without a Streamlit process.
+"""
+import argparse
+import gzip
+import json
+import os
+import shutil
+import urllib.parse
+from assets import IGV_CDN
+from graph_builder import create_network
+from locus_index import load_locus_index
+from node_detail import (ANNOTATION_FILE, DATA_DIR, GENOME_FILE, igv_options,
+                         iter_node_details)
+from node_store import GENE_TABLE_FILE, DATA_FILE, NodeStore, data_version, load_edge_table, load_gene_table
+from palette import NodePalette
+
+HUB_IMAGE_FILE = "lib/images/150px-Rotifer-1.jpg"
+LIB_DIRS = ["vis-9.1.2", "tom-select", "igv", "images"]
+# Vendored igv.js goes into the bundle when present; otherwise pages load it from the CDN
+IGV_SCRIPT = "lib/igv/igv.min.js" if os.path.exists(os.path.join("lib", "igv", "igv.min.js")) else IGV_CDN
+
+
+def file_name(node):
+    # One file per node id; quote() keeps ids with '/' or spaces safe on disk
+    return urllib.parse.quote(node, safe="") + ".json"
+
+
+def write_json(path, data, compress=False):
+    payload = json.dumps(data, separators=(",", ":")).encode()
+    if compress:
+        with gzip.open(path, "wb", compresslevel=9) as f:
+            f.write(payload)
+    else:
+        with open(path, "wb") as f:
+            f.write(payload)
+    return len(payload)
+
+
+# --- Bundle parts ---
+def export_graph(store, out_dir, palette, hub_image, selected_classes=(), layout="ring",
+                 image_size=50, font_size=14, connection_width=2, bg_color="#ffffff"):
+    # The same nodes, edges and options the app renders for these settings
+    net = create_network(store.edges, image_size, font_size, connection_width, list(selected_classes),
+                         bg_color, highlight_nodes=set(), node_colors=palette, hub_image=hub_image,
+                         layout=layout, content_hash=store.content_hash if layout == "force" else "",
+                         class_index=store.class_index)
+    graph = {"version": store.version, "bgColor": bg_color, "nodes": net.nodes, "edges": net.edges,
+             "options": net.options}
+    return write_json(os.path.join(out_dir, "graph.json.gz"), graph, compress=True)
+
+
+def export_nodes(store, out_dir, locus_index=None):
+    # nodes/<id>.json for the detail page, igv/<id>.json sessions for loci
+    os.makedirs(os.path.join(out_dir, "nodes"), exist_ok=True)
+    os.makedirs(os.path.join(out_dir, "igv"), exist_ok=True)
+    count = sessions = 0
+    for node, detail in iter_node_details(store, locus_index):
+        write_json(os.path.join(out_dir, "nodes", file_name(node)), detail)
+        count += 1
+        if detail["locus"]:
+            write_json(os.path.join(out_dir, "igv", file_name(node)), igv_options("", detail["locus"]))
+            sessions += 1
+    return count, sessions
+
+
+def export_assets(out_dir, with_data=False):
+    for name in LIB_DIRS:
+        src = os.path.join("lib", name)
+        if os.path.isdir(src):
+            shutil.copytree(src, os.path.join(out_dir, "lib", name), dirs_exist_ok=True)
+    if with_data:
+        # Genome and annotation files are large; by default the host serves data/ itself
+        os.makedirs(os.path.join(out_dir, DATA_DIR), exist_ok=True)
+        for name in (GENOME_FILE, GENOME_FILE + ".fai", ANNOTATION_FILE, ANNOTATION_FILE + ".tbi"):
+            src = os.path.join(DATA_DIR, name)
+            if os.path.exists(src):
+                shutil.copy2(src, os.path.join(out_dir, DATA_DIR, name))
+    for name, html in PAGES.items():
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            f.write(html)
+
+
+def export_site(out_dir, selected_classes=(), layout="ring", with_data=False):
+    store = NodeStore(load_edge_table(DATA_FILE), load_gene_table(GENE_TABLE_FILE),
+                      data_version(DATA_FILE, GENE_TABLE_FILE))
+    if store.edges is None:
+        raise FileNotFoundError(f"Data file '{DATA_FILE}' not found.")
+    os.makedirs(out_dir, exist_ok=True)
+    hub_image = HUB_IMAGE_FILE if os.path.exists(HUB_IMAGE_FILE) else ""
+    graph_bytes = export_graph(store, out_dir, NodePalette.build(store.edges), hub_image,
+                               selected_classes, layout)
+    nodes, sessions = export_nodes(store, out_dir, load_locus_index(store))
+    export_assets(out_dir, with_data)
+    return {"graph_bytes": graph_bytes, "nodes": nodes, "igv_sessions": sessions}
+
+
+# --- Static pages ---
+_LOAD_JSON = """
+async function loadJson(url) {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(url + ": " + response.status);
+  const bytes = new Uint8Array(await response.arrayBuffer());
+  // Hosts that send .gz with Content-Encoding: gzip hand over plain JSON already
+  if (bytes[0] === 0x1f && bytes[1] === 0x8b) {
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+    return JSON.parse(await new Response(stream).text());
+  }
+  return JSON.parse(new TextDecoder().decode(bytes));
+}
+// Same name as urllib.parse.quote(node, safe=""), then escaped again for the URL
+function nodeFile(node) {
+  const name = encodeURIComponent(node).replace(/[!'()*]/g, c => "%" + c.charCodeAt(0).toString(16).toUpperCase());
+  return encodeURIComponent(name + ".json");
+}
+"""
+
+PAGES = {
+    "index.html": """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>HGT Network</title>
+  <link rel="stylesheet" href="lib/vis-9.1.2/vis-network.css">
+  <script src="lib/vis-9.1.2/vis-network.min.js"></script>
+  <style>html, body, #network { margin: 0; width: 100%; height: 100%; }</style>
+</head>
+<body>
+  <div id="network"></div>
+  <script>""" + _LOAD_JSON + """
+    loadJson("graph.json.gz").then(graph => {
+      document.body.style.background = graph.bgColor;
+      const network = new vis.Network(document.getElementById("network"),
+        {nodes: new vis.DataSet(graph.nodes), edges: new vis.DataSet(graph.edges)}, graph.options);
+      network.on("doubleClick", params => {
+        if (params.nodes.length) window.open("node.html?node=" + encodeURIComponent(params.nodes[0]), "_blank");
+      });
+    });
+  </script>
+</body>
+</html>
+""",
+    "node.html": """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>Node details</title>
+  <style>
+    body { font-family: Arial, sans-serif; margin: 2rem; }
+    table { border-collapse: collapse; } td { border: 1px solid #ddd; padding: 4px 10px; }
+    a.button { display: inline-block; margin: 4px; padding: 8px 16px; background: #008CBA; color: white;
+               border-radius: 5px; text-decoration: none; }
+  </style>
+</head>
+<body>
+  <a href="index.html">&larr; Back to Network</a>
+  <h1 id="title"></h1>
+  <p id="locus"></p>
+  <h3>Node data</h3><table id="fields"></table>
+  <h3>Protein record</h3><table id="protein"></table>
+  <h3>External links</h3><div id="links"></div>
+  <script>""" + _LOAD_JSON + """
+    function fillTable(id, record) {
+      const table = document.getElementById(id);
+      for (const [key, value] of Object.entries(record || {})) {
+        const row = table.insertRow();
+        row.insertCell().textContent = key;
+        row.insertCell().textContent = value === null ? "" : value;
+      }
+    }
+    function addLink(parent, label, href) {
+      const a = document.createElement("a");
+      a.className = "button"; a.href = href; a.target = "_blank"; a.textContent = label;
+      parent.appendChild(a);
+    }
+    const node = new URLSearchParams(location.search).get("node");
+    document.getElementById("title").textContent = node;
+    loadJson("nodes/" + nodeFile(node)).then(detail => {
+      fillTable("fields", detail.fields);
+      fillTable("protein", detail.protein);
+      const links = document.getElementById("links");
+      for (const [name, url] of Object.entries(detail.links)) addLink(links, name, url);
+      if (detail.locus) {
+        const locus = document.getElementById("locus");
+        locus.textContent = "Locus: " + detail.locus + " ";
+        addLink(locus, "Open Genome Browser", "igv.html?node=" + encodeURIComponent(node));
+      }
+    }).catch(() => { document.getElementById("title").textContent = "Node '" + node + "' not found."; });
+  </script>
+</body>
+</html>
+""",
+    "igv.html": """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>IGV Genome Browser</title>
+  <script src=\"""" + IGV_SCRIPT + """\"></script>
+</head>
+<body>
+  <div id="igv-container" style="height:600px; border:1px solid #ccc;"></div>
+  <script>""" + _LOAD_JSON + """
+    const node = new URLSearchParams(location.search).get("node");
+    loadJson("igv/" + nodeFile(node)).then(session =>
+      igv.createBrowser(document.getElementById("igv-container"), session));
+  </script>
+</body>
+</html>
+""",
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the HGT network as a static site.")
+    parser.add_argument("--out", default="site", help="output directory (default: site)")
+    parser.add_argument("--classes", nargs="*", default=[], help="only export these classes")
+    parser.add_argument("--layout", choices=["ring", "force"], default="ring")
+    parser.add_argument("--with-data", action="store_true",
+                        help=f"copy the genome and annotation files from {DATA_DIR}/ into the bundle")
+    args = parser.parse_args(argv)
+    summary = export_site(args.out, args.classes, args.layout, args.with_data)
+    print(f"Wrote {args.out}: graph ({summary['graph_bytes']:,} bytes uncompressed), "
+          f"{summary['nodes']:,} node pages, {summary['igv_sessions']:,} IGV sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import atexit
+import functools
+import http.server
+import mmap
+import os
+import threading
+import time
+import uuid
+import streamlit as st
+from metrics import get_metrics
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ======================================================
+# ---------- FILE SERVER (with CORS) -------------------
+# ======================================================
+def parse_ranges(header, size):
+    # "bytes=0-99,200-,-50" -> [(start, end)] inclusive; None if the header is not
+    # a valid byte-range set (it is then ignored), [] if nothing is satisfiable.
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+    ranges = []
+    for part in spec.split(","):
+        first, sep, last = part.strip().partition("-")
+        if not sep:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = int(last) if last else max(start, size - 1)
+                if end < start:
+                    return None
+            else:
+                suffix = int(last)
+                start, end = max(size - suffix, 0), size - 1
+                if suffix == 0:
+                    continue
+        except ValueError:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+    return ranges
+
+
+class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.1 keeps igv.js' many small range requests on one connection
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, *args, metrics=None, **kwargs):
+        # Set before the base class handles the request inside __init__
+        self.metrics = metrics
+        self._status = 0
+        self._sent = 0
+        super().__init__(*args, **kwargs)
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def log_message(self, format, *args):
+        # Requests are counted in the metrics registry instead of on stderr
+        if self.metrics is None:
+            super().log_message(format, *args)
+
+    def end_headers(self):
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, HEAD, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "x-requested-with, content-type, range")
+        self.send_header("Access-Control-Expose-Headers", "Content-Range, Content-Length, Accept-Ranges")
+        return super().end_headers()
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path == "/metrics" and self.metrics is not None:
+            self.serve_metrics()
+        else:
+            self.timed(self.serve_file, send_body=True)
+
+    def do_HEAD(self):
+        self.timed(self.serve_file, send_body=False)
+
+    def timed(self, serve, **kwargs):
+        # Per request: latency histogram plus request and byte counters by status
+        start = time.perf_counter()
+        self._sent = 0
+        try:
+            serve(**kwargs)
+        finally:
+            if self.metrics is not None:
+                status = str(self._status)
+                self.metrics.observe("file_server_request_seconds", time.perf_counter() - start, status=status)
+                self.metrics.inc("file_server_requests_total", status=status)
+                self.metrics.inc("file_server_bytes_total", self._sent, status=status)
+
+    def serve_metrics(self):
+        body = self.metrics.prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def serve_file(self, send_body):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            # Directories, redirects and 404s keep the stock behaviour
+            return super().do_GET() if send_body else super().do_HEAD()
+        try:
+            f = open(path, "rb")
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            size = stat.st_size
+            ctype = self.guess_type(path)
+            header = self.headers.get("Range")
+            ranges = parse_ranges(header, size) if header else None
+
+            if ranges is not None and not ranges:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            if ranges is None:
+                self.send_response(200)
+                self.send_file_headers(ctype, size, stat)
+                self.end_headers()
+                if send_body:
+                    self.copy_range(f, 0, size)
+            elif len(ranges) == 1:
+                start, end = ranges[0]
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                self.send_file_headers(ctype, end - start + 1, stat)
+                self.end_headers()
+                if send_body:
+                    self.copy_range(f, start, end - start + 1)
+            else:
+                boundary = uuid.uuid4().hex
+                parts = [
+                    (f"--{boundary}\r\nContent-Type: {ctype}\r\n"
+                     f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n").encode("latin-1")
+                    for start, end in ranges
+                ]
+                closing = f"--{boundary}--\r\n".encode("latin-1")
+                length = sum(len(p) + (end - start + 1) + 2 for p, (start, end) in zip(parts, ranges)) + len(closing)
+                self.send_response(206)
+                self.send_file_headers(f"multipart/byteranges; boundary={boundary}", length, stat)
+                self.end_headers()
+                if send_body:
+                    for part, (start, end) in zip(parts, ranges):
+                        self.wfile.write(part)
+                        self.copy_range(f, start, end - start + 1)
+                        self.wfile.write(b"\r\n")
+                    self.wfile.write(closing)
+                    self._sent += sum(len(p) + 2 for p in parts) + len(closing)
+
+    def send_file_headers(self, ctype, length, stat):
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+
+    def copy_range(self, f, offset, count):
+        # wfile is unbuffered, so the body can go straight from the page cache
+        # to the socket after the headers.
+        if count <= 0:
+            return
+        try:
+            out = self.connection.fileno()
+            while count > 0:
+                sent = os.sendfile(out, f.fileno(), offset, count)
+                if sent == 0:
+                    break
+                offset += sent
+                count -= sent
+                self._sent += sent
+        except (AttributeError, OSError) as exc:
+            if isinstance(exc, (BrokenPipeError, ConnectionResetError)):
+                raise
+            # No sendfile (e.g. Windows): write slices of a read-only mapping
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    self.wfile.write(view[offset:offset + count])
+                    self._sent += count
+                finally:
+                    view.release()
+
+
+class FileServer:
+    """Threaded static file server for igv.js data, one per process."""
+
+    def __init__(self, root=ROOT_DIR, host="", port=0, metrics=None):
+        handler = functools.partial(CORSRequestHandler, directory=root, metrics=metrics)
+        # One thread per connection, so a slow transfer does not block other requests
+        self.httpd = http.server.ThreadingHTTPServer((host, port), handler)
+        self.port = self.httpd.server_address[1]
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="igv-file-server", daemon=True)
+        self._thread.start()
+
+    @property
+    def running(self):
+        return not self._closed and self._thread.is_alive()
+
+    @property
+    def base_url(self):
+        return f"http://localhost:{self.port}"
+
+    @property
+    def metrics_url(self):
+        return f"{self.base_url}/metrics"
+
+    def shutdown(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread.join(timeout=5)
+
+
+# validate= restarts the server if it was shut down or its thread died
+@st.cache_resource(show_spinner=False, validate=lambda server: server.running)
+def get_file_server():
+    # A fixed FILE_SERVER_PORT gives scrapers a stable /metrics address
+    server = FileServer(port=int(os.environ.get("FILE_SERVER_PORT", 0)), metrics=get_metrics())
+    atexit.register(server.shutdown)
+    return server
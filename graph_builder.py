@@ -0,0 +1,411 @@
+from itertools import repeat
+import numpy as np
+import pandas as pd
+from pyvis.network import Network
+from graph_model import ClassIndex, HGTGraph, hub_positions
+from layout_engine import LAYOUT_DIR, cached_graph_layout, layout_exists, layout_key
+
+# --- Column helpers ---
+_HEX_DIGITS = np.full(256, -1, dtype=np.int64)
+for _i, _c in enumerate("0123456789abcdef"):
+    _HEX_DIGITS[ord(_c)] = _i
+    _HEX_DIGITS[ord(_c.upper())] = _i
+
+
+def hex_to_int(colors):
+    # "#RRGGBB" strings -> integers, without a Python int() call per colour
+    if len(colors) == 0:
+        return np.zeros(0, dtype=np.int64)
+    raw = np.frombuffer("".join(c[1:7] for c in colors).encode("ascii"), dtype=np.uint8)
+    digits = _HEX_DIGITS[raw].reshape(-1, 6)
+    return digits @ (16 ** np.arange(5, -1, -1, dtype=np.int64))
+
+
+def contrast_font_colors(colors):
+    return np.where(hex_to_int(colors) > 0x888888, "#000000", "#ffffff")
+
+
+def tooltip_column(rows, columns):
+    # Same text as "".join(f"{col}: {row[col]}\n" for col in columns), built per column
+    text = pd.Series("", index=rows.index)
+    for col in columns:
+        values = rows[col]
+        # Missing cells read "nan" whether the column is object or Arrow-backed
+        text = text + f"{col}: " + values.astype(str).where(values.notna(), "nan") + "\n"
+    return text
+
+
+def records(columns, mask=None):
+    # Column arrays / scalars -> list of vis.js dicts; tolist() yields native Python values
+    cols = []
+    for v in columns.values():
+        if np.ndim(v):
+            v = np.asarray(v, dtype=object) if isinstance(v, list) else np.asarray(v)
+            cols.append((v[mask] if mask is not None else v).tolist())
+        else:
+            cols.append(repeat(v))
+    keys = list(columns)
+    return [dict(zip(keys, vals)) for vals in zip(*cols)]
+
+
+# --- Batched node/edge arrays ---
+def satellite_batch(node_rows, columns, x, y, to, image_size, font_size, connection_width,
+                    highlight_nodes, node_colors, font_color=None, skip_ids=()):
+    # Styled node and edge dicts for one row per source; `to` is a node id or an
+    # array with one target per row.
+    sources = node_rows["source"]
+    n_sources = len(sources)
+    colors, font_colors = node_colors.styles(sources.to_numpy())
+    highlighted = sources.isin(highlight_nodes).to_numpy()
+    if font_color:
+        # pyvis replaces each node's font with the network-wide font colour
+        fonts = [{"color": font_color} for _ in range(n_sources)]
+    else:
+        fonts = [{"size": font_size, "color": c} for c in font_colors.tolist()]
+
+    # Key order follows pyvis' Node/Edge so the generated HTML is unchanged.
+    # A source that is also a hub is skipped, as pyvis keeps the first node.
+    nodes = records({
+        "color": colors,
+        "size": image_size,
+        "font": fonts,
+        "borderWidth": np.where(highlighted, 4, 2),
+        "title": tooltip_column(node_rows, columns).to_numpy(),
+        "x": x,
+        "y": y,
+        "physics": False,
+        "id": sources.to_numpy(),
+        "label": sources.to_numpy(),
+        "shape": "box",
+    }, mask=~sources.isin(skip_ids).to_numpy() if len(skip_ids) else None)
+    return nodes, edge_records(sources, to, highlight_nodes, connection_width)
+
+
+def edge_records(sources, to, highlight_nodes, connection_width):
+    highlighted = sources.isin(highlight_nodes).to_numpy()
+    return records({
+        "color": np.where(highlighted, "#FFD700", "#7f8c8d"),
+        "width": np.where(highlighted, connection_width * 2, connection_width),
+        "from": sources.to_numpy(),
+        "to": to,
+    })
+
+
+def add_batch(net, nodes, edges):
+    ids = [n["id"] for n in nodes]
+    net.nodes.extend(nodes)
+    net.node_ids.extend(ids)
+    net.node_map.update(zip(ids, nodes))
+    net.edges.extend(edges)
+
+
+# --- Network ---
+def new_network(bg_color):
+    return Network(height="750px", width="100%", bgcolor=bg_color, font_color="black", notebook=False)
+
+
+def add_hubs(net, hubs, hub_x, hub_y, hub_image, image_size, font_size):
+    # One image node per target genome; a lone hub keeps vis.js' default
+    # placement at the origin, several hubs get explicit positions
+    for i, hub in enumerate(hubs):
+        position = {} if len(hubs) == 1 else {"x": float(hub_x[i]), "y": float(hub_y[i])}
+        net.add_node(
+            hub, label="", shape="image", image=hub_image, size=image_size,
+            color={"background":"#ffffff","border":"#ffffff"},
+            font={"size":font_size,"color":"#000000"}, physics=False, **position
+        )
+
+
+def set_network_options(net, font_size, connection_width):
+    net.set_options(f"""
+    {{
+      "nodes": {{
+        "font": {{ "size": {font_size}, "face": "Arial" }},
+        "shapeProperties": {{ "borderRadius": 2 }}
+      }},
+      "edges": {{
+        "smooth": {{ "enabled": true, "type": "curvedCW" }},
+        "width": {connection_width}
+      }},
+      "physics": {{ "enabled": false }},
+      "interaction": {{ "hover": true }}
+    }}
+    """)
+
+
+def class_filter_rows(df, selected_classes, class_index=None):
+    # Positional rows kept by the class filter (None keeps every row). A
+    # prebuilt ClassIndex answers from per-class row slices, no scan needed.
+    if "class" not in df.columns or not selected_classes:
+        return None
+    if class_index is None:
+        class_index = ClassIndex.from_values(df["class"])
+    return class_index.rows(selected_classes)
+
+
+def filter_classes(df, selected_classes, class_index=None):
+    rows = class_filter_rows(df, selected_classes, class_index)
+    return df if rows is None else df.iloc[rows]
+
+
+def hub_order(df):
+    # Every target is a hub, busiest first, whether or not a filter leaves it satellites
+    return df["target"].value_counts().index
+
+
+def node_class_codes(graph, df):
+    # Class code of each graph node (taken from its first edge); hubs get -1
+    codes = np.full(graph.n_nodes, -1, dtype=np.int64)
+    if "class" in df.columns and graph.n_edges:
+        first = graph.first_edges()
+        row_codes, _ = pd.factorize(df["class"].astype(object).to_numpy()[graph.edge_rows[first]])
+        codes[graph.indices[first]] = row_codes
+    codes[graph.hub_ids] = -1
+    return codes
+
+
+def force_positions(graph, df, content_hash, selected_classes, layout_dir=LAYOUT_DIR):
+    # Force-directed coordinates, computed once per file.txt content and filter;
+    # a changed file warm-starts from the last layout for the same filter
+    key = force_layout_key(content_hash, selected_classes)
+    return cached_graph_layout(graph, node_class_codes(graph, df), key, layout_dir,
+                               warm_key=layout_key("", selected_classes or ()))
+
+
+def force_layout_key(content_hash, selected_classes):
+    return layout_key(content_hash, selected_classes or ())
+
+
+def force_layout_ready(content_hash, selected_classes, layout_dir=LAYOUT_DIR):
+    return layout_exists(force_layout_key(content_hash, selected_classes), layout_dir)
+
+
+def compute_force_layout(df, content_hash, selected_classes=(), class_index=None, layout_dir=LAYOUT_DIR):
+    # Same graph and cache entry as create_network(layout="force") for this
+    # filter; the unfiltered one is also build_base_graph's
+    rows = class_filter_rows(df, list(selected_classes), class_index)
+    graph = HGTGraph.from_table(df, hubs=hub_order(df), rows=rows)
+    force_positions(graph, df, content_hash, list(selected_classes), layout_dir)
+    return graph.n_nodes
+
+
+def create_network(df, image_size, font_size, connection_width, selected_classes, bg_color,
+                   highlight_nodes, node_colors, hub_image, layout="ring", content_hash="", class_index=None,
+                   layout_dir=LAYOUT_DIR):
+    net = new_network(bg_color)
+    # The filter only narrows the rows the graph is built from; `df` is not copied
+    rows = class_filter_rows(df, selected_classes, class_index)
+    graph = HGTGraph.from_table(df, hubs=hub_order(df), rows=rows)
+    if layout == "force":
+        x, y = force_positions(graph, df, content_hash, selected_classes, layout_dir)
+    else:
+        x, y = graph.layout()
+    hubs = graph.hubs
+    add_hubs(net, hubs, x[graph.hub_ids], y[graph.hub_ids], hub_image, image_size, font_size)
+
+    # One node per source at its first edge; further hubs get extra edges only
+    first = graph.first_edges()
+    edge_hub = graph.edge_hubs()
+    node_rows = df.iloc[graph.edge_rows[first]]
+    node_ids = graph.indices[first]
+    highlight_nodes = set(highlight_nodes)
+    nodes, edges = satellite_batch(node_rows, df.columns, x[node_ids], y[node_ids], hubs[edge_hub[first]],
+                                   image_size, font_size, connection_width, highlight_nodes,
+                                   node_colors, font_color=net.font_color, skip_ids=set(hubs))
+    add_batch(net, nodes, edges)
+
+    if len(first) < graph.n_edges:
+        extra = np.setdiff1d(np.arange(graph.n_edges), first)
+        extra_sources = pd.Series(graph.names[graph.indices[extra]])
+        add_batch(net, [], edge_records(extra_sources, hubs[edge_hub[extra]], highlight_nodes, connection_width))
+
+    set_network_options(net, font_size, connection_width)
+    return net
+
+
+# --- Level of detail: one super-node per class ---
+UNCLASSIFIED = "Unclassified"
+CLUSTER_PREFIX = "class:"
+CLUSTER_COLORS = ["#4e79a7", "#f28e2b", "#e15759", "#76b7b2", "#59a14f",
+                  "#edc948", "#b07aa1", "#ff9da7", "#9c755f", "#bab0ac"]
+
+
+def class_labels(df):
+    if "class" not in df.columns:
+        return pd.Series(UNCLASSIFIED, index=df.index)
+    return df["class"].astype(object).fillna(UNCLASSIFIED)
+
+
+def class_summary(df):
+    # Per class: distinct source nodes and HGT edges (rows)
+    labels = class_labels(df)
+    grouped = df["source"].groupby(labels.to_numpy(), sort=True)
+    return pd.DataFrame({"nodes": grouped.nunique(), "edges": grouped.size()})
+
+
+def sub_ring_positions(centers_x, centers_y, groups):
+    # Members of each group on a small ring around that group's centre
+    rank = groups.groupby(groups.to_numpy()).cumcount().to_numpy()
+    size = groups.map(groups.value_counts()).to_numpy()
+    radius = 80 + size * 4
+    angle = 2 * np.pi * rank / np.maximum(size, 1)
+    return centers_x + radius * np.cos(angle), centers_y + radius * np.sin(angle)
+
+
+def create_cluster_network(df, image_size, font_size, connection_width, selected_classes, bg_color,
+                           highlight_nodes, node_colors, hub_image, expanded_classes=(), node_limit=500,
+                           class_index=None):
+    # Collapsed classes cost one node each; only expanded classes (and
+    # highlighted nodes) are materialised, capped at `node_limit` per view.
+    net = new_network(bg_color)
+    filtered_df = filter_classes(df, selected_classes, class_index)
+    highlight_nodes = set(highlight_nodes)
+
+    # Hubs on a small inner ring, class super-nodes on a ring around them
+    hubs = np.asarray(hub_order(df), dtype=object)
+    hub_x, hub_y = hub_positions(np.full(len(hubs), 100))
+    add_hubs(net, hubs, hub_x, hub_y, hub_image, image_size, font_size)
+
+    summary = class_summary(filtered_df)
+    class_names = summary.index.to_numpy()
+    n_classes = len(class_names)
+    radius = 400 + n_classes * 40 + np.abs(hub_x).max(initial=0)
+    angle = 2 * np.pi * np.arange(n_classes) / max(n_classes, 1)
+    cx, cy = radius * np.cos(angle), radius * np.sin(angle)
+    cluster_ids = np.array([CLUSTER_PREFIX + str(c) for c in class_names], dtype=object)
+
+    # Members to show: highlighted first, then expanded classes, up to the limit
+    labels = class_labels(filtered_df)
+    wanted = labels.isin(expanded_classes) | filtered_df["source"].isin(highlight_nodes)
+    members = filtered_df[wanted.to_numpy()].drop_duplicates("source")
+    members = members.iloc[np.argsort(~members["source"].isin(highlight_nodes).to_numpy(), kind="stable")]
+    members = members.iloc[:node_limit]
+    member_labels = class_labels(members)
+    hidden = summary["nodes"].sub(member_labels.value_counts(), fill_value=0).astype(int)
+
+    counts = summary["nodes"].to_numpy()
+    cluster_nodes = records({
+        "color": [CLUSTER_COLORS[i % len(CLUSTER_COLORS)] for i in range(n_classes)],
+        "size": image_size * (0.5 + 0.25 * np.log10(1 + counts)),
+        "font": {"size": font_size, "color": "#000000"},
+        "borderWidth": 2,
+        "title": [f"{c}\n{n:,} nodes\n{e:,} HGT edges" for c, n, e in
+                  zip(class_names, counts, summary["edges"].to_numpy())],
+        "x": cx,
+        "y": cy,
+        "physics": False,
+        "id": cluster_ids,
+        "label": [f"{c} ({n:,})" for c, n in zip(class_names, counts)],
+        "shape": "dot",
+    })
+    # Summed edges per (class, target): width grows with the log of the edge count
+    pair_counts = filtered_df.groupby(
+        [class_labels(filtered_df).to_numpy(), filtered_df["target"].astype(object).to_numpy()]
+    ).size()
+    pair_class = pair_counts.index.get_level_values(0).to_numpy()
+    pair_target = pair_counts.index.get_level_values(1).to_numpy()
+    cluster_edges = records({
+        "color": "#7f8c8d",
+        "width": connection_width * (1 + np.log10(pair_counts.to_numpy())),
+        "title": [f"{e:,} HGT edges" for e in pair_counts.to_numpy()],
+        "from": np.array([CLUSTER_PREFIX + str(c) for c in pair_class], dtype=object),
+        "to": pair_target,
+    })
+    add_batch(net, cluster_nodes, cluster_edges)
+
+    if len(members):
+        pos = pd.Series(np.arange(n_classes), index=class_names)
+        member_class = pos.reindex(member_labels.to_numpy()).to_numpy()
+        x, y = sub_ring_positions(cx[member_class], cy[member_class], member_labels)
+        nodes, edges = satellite_batch(members, df.columns, x, y, cluster_ids[member_class],
+                                       image_size, font_size, connection_width, highlight_nodes,
+                                       node_colors, net.font_color, skip_ids=set(hubs))
+        add_batch(net, nodes, edges)
+
+    # Expanded classes cut short by the node limit get a "+N more" marker
+    more = hidden.reindex([c for c in class_names if c in set(expanded_classes)])
+    more = more[more > 0]
+    if len(more):
+        idx = pd.Series(np.arange(n_classes), index=class_names).reindex(more.index).to_numpy()
+        more_ids = np.array([f"{CLUSTER_PREFIX}{c}:more" for c in more.index], dtype=object)
+        add_batch(net, records({
+            "color": "#ecf0f1",
+            "size": image_size,
+            "title": [f"{n:,} more nodes in {c}" for c, n in more.items()],
+            "x": cx[idx] * 1.25,
+            "y": cy[idx] * 1.25,
+            "physics": False,
+            "id": more_ids,
+            "label": [f"+{n:,} more" for n in more.to_numpy()],
+            "shape": "box",
+        }), records({"color": "#bdc3c7", "dashes": True, "from": more_ids, "to": cluster_ids[idx]}))
+
+    set_network_options(net, font_size, connection_width)
+    return net
+
+
+# --- Base graph for the incremental network component ---
+def build_base_graph(df, node_colors, hub_image, version, layout="ring", content_hash=""):
+    # Every source is laid out once; size, font, widths, highlight and class
+    # visibility are applied in the browser as deltas on top of this graph.
+    graph = HGTGraph.from_table(df, hubs=hub_order(df))
+    if layout == "force":
+        x, y = force_positions(graph, df, content_hash, ())
+    else:
+        x, y = graph.layout()
+    hubs = graph.hubs
+    first = graph.first_edges()
+    node_ids = graph.indices[first]
+    keep = ~np.isin(node_ids, graph.hub_ids)
+    node_rows = df.iloc[graph.edge_rows[first][keep]]
+    node_ids = node_ids[keep]
+    sources = node_rows["source"].to_numpy()
+    classes = None
+    if "class" in df.columns:
+        # Missing classes get the Unclassified label so a class filter can
+        # hide them, as the filtered full render leaves them out
+        classes = class_labels(node_rows)
+
+    single = len(hubs) == 1
+    hub_nodes = records({
+        "id": hubs,
+        "label": "",
+        "shape": "image",
+        "image": hub_image,
+        "color": {"background": "#ffffff", "border": "#ffffff"},
+        "physics": False,
+        "x": 0.0 if single else x[graph.hub_ids],
+        "y": 0.0 if single else y[graph.hub_ids],
+    })
+    nodes = hub_nodes + records({
+        "id": sources,
+        "label": sources,
+        "shape": "box",
+        "color": node_colors.styles(sources)[0],
+        "title": tooltip_column(node_rows, df.columns).to_numpy(),
+        "x": x[node_ids],
+        "y": y[node_ids],
+        "physics": False,
+        "cls": classes.to_numpy(dtype=object) if classes is not None else None,
+    })
+    edge_from = graph.names[graph.indices]
+    edge_to = hubs[graph.edge_hubs()]
+    edges = records({
+        "id": [f"{a}\u2192{b}" for a, b in zip(edge_from, edge_to)],
+        "from": edge_from,
+        "to": edge_to,
+    })
+    options = {
+        "nodes": {
+            "font": {"face": "Arial", "color": "black"},
+            "borderWidth": 2,
+            "shapeProperties": {"borderRadius": 2},
+        },
+        "edges": {
+            "color": {"color": "#7f8c8d", "inherit": False},
+            "smooth": {"enabled": True, "type": "curvedCW"},
+        },
+        "physics": {"enabled": False},
+        "interaction": {"hover": True},
+    }
+    return {"version": version, "hubs": hubs.tolist(), "nodes": nodes, "edges": edges, "options": options}
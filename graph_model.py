@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+
+
+# --- Hub/satellite graph with interned node ids ---
+class HGTGraph:
+    """HGT edges grouped by target hub, stored as CSR integer arrays.
+
+    `names[i]` is the id of node i (sources and targets share one id space).
+    Satellites of hub h are `indices[indptr[h]:indptr[h + 1]]`, in table order;
+    `edge_rows` holds the positional row of each (source, target) edge.
+    """
+
+    def __init__(self, names, hub_ids, indptr, indices, edge_rows):
+        self.names = names
+        self.hub_ids = hub_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_rows = edge_rows
+
+    @classmethod
+    def from_table(cls, df, hubs=None, rows=None):
+        # `hubs` fixes the hub order (and keeps hubs with no satellites in a
+        # filtered table); by default targets are ordered by edge count.
+        # `rows` restricts the graph to those positional rows without copying
+        # the table; `edge_rows` then still index into `df`.
+        sources = df["source"].astype(object).to_numpy()
+        targets = df["target"].astype(object).to_numpy()
+        selected = None if rows is None else np.asarray(rows, dtype=np.int64)
+        if selected is not None:
+            sources, targets = sources[selected], targets[selected]
+        if hubs is None:
+            hubs = pd.Series(targets).value_counts().index
+        hubs = np.asarray(list(hubs), dtype=object)
+        codes, names = pd.factorize(np.concatenate([hubs, targets, sources]))
+        names = np.asarray(names, dtype=object)
+        n_hubs, n_rows = len(hubs), len(sources)
+        hub_ids = codes[:n_hubs].astype(np.int32)
+        target_ids = codes[n_hubs:n_hubs + n_rows].astype(np.int32)
+        source_ids = codes[n_hubs + n_rows:].astype(np.int32)
+
+        # Hub slot per row; rows pointing at an unknown target are dropped
+        slot = np.full(len(names), -1, dtype=np.int64)
+        slot[hub_ids] = np.arange(n_hubs)
+        row_slot = slot[target_ids]
+        rows = np.flatnonzero(row_slot >= 0)
+
+        # One edge per (hub, source) pair, first row wins, table order kept
+        pair = row_slot[rows] * len(names) + source_ids[rows]
+        _, first = np.unique(pair, return_index=True)
+        rows = rows[np.sort(first)]
+        order = np.argsort(row_slot[rows], kind="stable")
+        rows = rows[order]
+        indptr = np.searchsorted(row_slot[rows], np.arange(n_hubs + 1)).astype(np.int64)
+        edge_rows = rows if selected is None else selected[rows]
+        return cls(names, hub_ids, indptr, source_ids[rows], edge_rows)
+
+    @property
+    def n_nodes(self):
+        return len(self.names)
+
+    @property
+    def n_edges(self):
+        return len(self.indices)
+
+    @property
+    def hubs(self):
+        return self.names[self.hub_ids]
+
+    def degree(self):
+        return np.diff(self.indptr)
+
+    def edge_hubs(self):
+        # Hub slot of every edge, aligned with `indices`
+        return np.repeat(np.arange(len(self.hub_ids)), self.degree())
+
+    def satellites(self, h):
+        return self.indices[self.indptr[h]:self.indptr[h + 1]]
+
+    def first_edges(self):
+        # Edge positions where each satellite node first appears
+        _, first = np.unique(self.indices, return_index=True)
+        return np.sort(first)
+
+    # --- Layout ---
+    def layout(self):
+        # Hubs on a ring sized so neighbouring satellite rings do not overlap;
+        # each hub's satellites on a ring of radius 400 + 2 * degree around it.
+        # A single hub sits at the origin, matching the original ring layout.
+        degree = self.degree()
+        ring = 400 + degree * 2
+        hub_x, hub_y = hub_positions(ring)
+        x = np.zeros(self.n_nodes)
+        y = np.zeros(self.n_nodes)
+        if self.n_edges:
+            hub = self.edge_hubs()
+            rank = np.arange(self.n_edges) - self.indptr[hub]
+            angle = 2 * np.pi * (rank / np.maximum(degree[hub], 1))
+            edge_x = hub_x[hub] + ring[hub] * np.cos(angle)
+            edge_y = hub_y[hub] + ring[hub] * np.sin(angle)
+            # A satellite shared by several hubs stays where it first appears
+            first = self.first_edges()
+            x[self.indices[first]] = edge_x[first]
+            y[self.indices[first]] = edge_y[first]
+        x[self.hub_ids] = hub_x
+        y[self.hub_ids] = hub_y
+        return x, y
+
+
+def hub_positions(ring_radii):
+    n_hubs = len(ring_radii)
+    if n_hubs <= 1:
+        return np.zeros(n_hubs), np.zeros(n_hubs)
+    spacing = 2 * ring_radii.max() + 200
+    radius = spacing / (2 * np.sin(np.pi / n_hubs))
+    angle = 2 * np.pi * np.arange(n_hubs) / n_hubs
+    return radius * np.cos(angle), radius * np.sin(angle)
+
+
+# --- Class filter ---
+class ClassIndex:
+    """Edge rows grouped by class, factorized once.
+
+    `codes[i]` is the class code of row i (-1 when missing); the rows of class
+    c are `order[indptr[c + 1]:indptr[c + 2]]`, ascending, so any set of
+    classes resolves to row positions by joining slices, with no table scan.
+    """
+
+    def __init__(self, codes, names):
+        self.codes = codes
+        self.names = names
+        self._codes_by_name = {name: i for i, name in enumerate(names)}
+        self.order = np.argsort(codes, kind="stable")
+        self.indptr = np.searchsorted(codes[self.order], np.arange(-1, len(names) + 1))
+
+    @classmethod
+    def from_values(cls, values):
+        values = pd.Series(values)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Categorical columns already carry their codes
+            return cls(values.cat.codes.to_numpy(dtype=np.int32), np.asarray(values.cat.categories, dtype=object))
+        codes, names = pd.factorize(values.astype(object), sort=True)
+        return cls(codes.astype(np.int32), np.asarray(names, dtype=object))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def class_rows(self, name):
+        c = self._codes_by_name.get(name)
+        if c is None:
+            return np.array([], dtype=np.int64)
+        return self.order[self.indptr[c + 1]:self.indptr[c + 2]]
+
+    def rows(self, selected_classes):
+        # Positional rows in any selected class; None means no filter
+        if not selected_classes:
+            return None
+        parts = [self.class_rows(name) for name in dict.fromkeys(selected_classes)]
+        return np.sort(np.concatenate(parts)) if parts else np.array([], dtype=np.int64)
+
+    def counts(self):
+        return pd.Series(np.diff(self.indptr)[1:], index=self.names)
@@ -0,0 +1,221 @@
+import json
+import os
+import shutil
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+from graph_builder import UNCLASSIFIED
+from table_cache import CACHE_DIR, pa, source_signature
+
+CHUNK_ROWS = 200_000
+STORE_FORMAT = 2
+
+IngestedTable = namedtuple("IngestedTable", "edges node_index class_stats")
+
+
+# --- Interning ---
+class Interner:
+    """Strings -> dense int32 codes in order of first appearance (-1 = missing)."""
+
+    def __init__(self):
+        self.codes = {}
+        self.names = []
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, values):
+        # Factorize the chunk, then map only its distinct values to global codes
+        local, uniques = pd.factorize(np.asarray(values, dtype=object))
+        lookup = np.empty(len(uniques), dtype=np.int32)
+        for i, value in enumerate(uniques.tolist()):
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.names)
+                self.names.append(value)
+            lookup[i] = code
+        return np.where(local >= 0, lookup[np.maximum(local, 0)], -1).astype(np.int32)
+
+
+def grow(counts, size):
+    return counts if len(counts) >= size else np.concatenate([counts, np.zeros(size - len(counts), counts.dtype)])
+
+
+# --- Store layout ---
+def store_dir(path, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, os.path.basename(path) + ".store")
+
+
+def ingest_table(path, key_column="source", class_column="class", categorical=(), chunk_rows=CHUNK_ROWS,
+                 cache_dir=CACHE_DIR):
+    """Stream a TSV into an on-disk store, one chunk at a time.
+
+    `key_column`, `class_column` and the `categorical` columns are interned to
+    int32 codes (one dictionary file per interned column); every other column,
+    such as the near-unique description, is written to rows.arrow as plain
+    strings and never held beyond its chunk. Peak memory is one parsed chunk
+    plus the distinct values of the interned columns. The first row of each
+    `key_column` value and per-class node/edge counts are accumulated on the way.
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow is required for streaming ingestion")
+    out = store_dir(path, cache_dir)
+    tmp = out + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    signature = source_signature(path).decode()
+
+    reader = pd.read_csv(path, sep="\t", dtype=str, chunksize=chunk_rows)
+    columns = interned = interners = writer = None
+    first_rows = np.zeros(0, dtype=np.int64)
+    class_edges = np.zeros(0, dtype=np.int64)
+    class_nodes = np.zeros(0, dtype=np.int64)
+    missing_class = {"nodes": 0, "edges": 0}
+    n_rows = 0
+    try:
+        for chunk in reader:
+            if columns is None:
+                columns = list(chunk.columns)
+                wanted = {key_column, class_column, *categorical}
+                interned = [col for col in columns if col in wanted]
+                interners = {col: Interner() for col in interned}
+                schema = pa.schema([(col, pa.int32() if col in interners else pa.string()) for col in columns])
+                writer = pa.ipc.new_file(os.path.join(tmp, "rows.arrow"), schema)
+            codes = {col: interners[col].intern(chunk[col].to_numpy()) for col in interned}
+            arrays = [pa.array(codes[col]) if col in codes else
+                      pa.array(chunk[col].to_numpy(), type=pa.string(), from_pandas=True) for col in columns]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+
+            if key_column in codes:
+                # Keys first seen in this chunk: remember their row (and class)
+                keys = codes[key_column]
+                known = len(first_rows)
+                first_rows = grow(first_rows, len(interners[key_column]))
+                fresh = keys >= known
+                new_keys, first = np.unique(keys[fresh], return_index=True)
+                new_rows = np.flatnonzero(fresh)[first]
+                first_rows[new_keys] = n_rows + new_rows
+                if class_column in codes:
+                    classes = codes[class_column]
+                    size = len(interners[class_column])
+                    class_edges = grow(class_edges, size)
+                    class_nodes = grow(class_nodes, size)
+                    class_edges += np.bincount(classes[classes >= 0], minlength=size)
+                    node_classes = classes[new_rows]
+                    class_nodes += np.bincount(node_classes[node_classes >= 0], minlength=size)
+                    missing_class["edges"] += int((classes < 0).sum())
+                    missing_class["nodes"] += int((node_classes < 0).sum())
+            n_rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    if columns is None:
+        shutil.rmtree(tmp, ignore_errors=True)
+        return None
+
+    for i, col in enumerate(columns):
+        if col not in interners:
+            continue
+        table = pa.table({"value": pa.array(interners[col].names, type=pa.string())})
+        with pa.ipc.new_file(os.path.join(tmp, f"dict_{i}.arrow"), table.schema) as dict_writer:
+            dict_writer.write_table(table)
+    np.save(os.path.join(tmp, "first_rows.npy"), first_rows)
+    stats = {}
+    if class_column in interners:
+        stats = {name: {"nodes": int(n), "edges": int(e)}
+                 for name, n, e in zip(interners[class_column].names, class_nodes, class_edges)}
+        if missing_class["edges"]:
+            stats[UNCLASSIFIED] = missing_class
+    with open(os.path.join(tmp, "meta.json"), "w") as f:
+        json.dump({"signature": signature, "format": STORE_FORMAT, "columns": columns, "interned": interned,
+                   "rows": n_rows, "key_column": key_column, "class_stats": stats}, f)
+    shutil.rmtree(out, ignore_errors=True)
+    os.replace(tmp, out)
+    return out
+
+
+def load_store(path, categorical=(), cache_dir=CACHE_DIR):
+    """Ingested table as a DataFrame (None when missing or stale).
+
+    Columns in `categorical` come back as sorted-category Categoricals built
+    from the stored codes, other interned columns as Categoricals in first-seen
+    order; numeric columns as numbers. Columns stored as plain strings stay
+    Arrow strings over the memory-mapped rows.arrow, so descriptions and the
+    like are paged in by the OS as rows are read, never copied into Python
+    objects up front.
+    """
+    out = store_dir(path, cache_dir)
+    meta_path = os.path.join(out, "meta.json")
+    if pa is None or not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get("format") != STORE_FORMAT or meta.get("signature") != source_signature(path).decode():
+            return None
+        # Not closed here: the string columns keep pointing into the mapping
+        rows = pa.ipc.open_file(pa.memory_map(os.path.join(out, "rows.arrow"))).read_all()
+        data = {}
+        node_index = {}
+        first_rows = np.load(os.path.join(out, "first_rows.npy"))
+        for i, col in enumerate(meta["columns"]):
+            if col not in meta["interned"]:
+                data[col] = decode_strings(rows.column(col))
+                continue
+            with pa.memory_map(os.path.join(out, f"dict_{i}.arrow")) as source:
+                names = pa.ipc.open_file(source).read_all().column("value").to_numpy(zero_copy_only=False)
+            names = names.astype(object)
+            data[col] = decode_column(rows.column(col).to_numpy(), names, col in categorical)
+            if col == meta["key_column"]:
+                # One entry per distinct key, straight from the ingest pass
+                node_index = dict(zip(names.tolist(), first_rows.tolist()))
+        edges = pd.DataFrame(data)
+    except (OSError, ValueError, KeyError, pa.ArrowInvalid):
+        return None
+    stats = pd.DataFrame.from_dict(meta["class_stats"], orient="index", columns=["nodes", "edges"])
+    return IngestedTable(edges, node_index, stats.sort_index())
+
+
+def decode_column(codes, names, categorical):
+    numeric = pd.to_numeric(pd.Series(names, dtype=object), errors="coerce")
+    if not categorical and len(names) and numeric.notna().all():
+        values = numeric.to_numpy()[np.maximum(codes, 0)]
+        if (codes < 0).any():
+            values = np.where(codes < 0, np.nan, values.astype(float))
+        return values
+    if categorical:
+        # Same category order pandas gives astype("category"): sorted
+        order = np.argsort(names, kind="stable")
+        remap = np.empty(len(names), dtype=np.int32)
+        remap[order] = np.arange(len(names), dtype=np.int32)
+        codes = np.where(codes >= 0, remap[np.maximum(codes, 0)], -1)
+        names = names[order]
+    return pd.Categorical.from_codes(codes, categories=pd.Index(names, dtype=object))
+
+
+def decode_strings(column):
+    # Streamed string column -> numbers when every value parses, else a
+    # zero-copy pandas view of the Arrow strings
+    for numeric in (pa.int64(), pa.float64()):
+        try:
+            return column.cast(numeric).to_numpy()
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            continue
+    return pd.arrays.ArrowExtensionArray(column)
+
+
+def read_ingested(path, categorical=(), key_column="source", class_column="class",
+                  chunk_rows=CHUNK_ROWS, cache_dir=CACHE_DIR):
+    # Load the store, (re)ingesting first whenever the TSV has changed; None
+    # when pyarrow is missing or the cache cannot be written
+    if pa is None:
+        return None
+    table = load_store(path, categorical, cache_dir)
+    if table is None:
+        try:
+            if ingest_table(path, key_column, class_column, categorical, chunk_rows, cache_dir) is None:
+                return None
+        except OSError:
+            return None
+        table = load_store(path, categorical, cache_dir)
+    return table
@@ -0,0 +1,273 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import streamlit as st
+from table_cache import CACHE_DIR
+
+LAYOUT_DIR = os.path.join(CACHE_DIR, "layouts")
+LAYOUT_VERSION = 3
+logger = logging.getLogger(__name__)
+EXACT_LIMIT = 3000  # above this, repulsion comes from grid cells (Barnes-Hut style)
+
+
+# --- Force-directed layout (Fruchterman-Reingold, vectorised) ---
+def _exact_repulsion(pos, k2, chunk=1024):
+    x, y = pos[:, 0], pos[:, 1]
+    disp = np.zeros_like(pos)
+    for start in range(0, len(pos), chunk):
+        dx = x[start:start + chunk, None] - x[None, :]
+        dy = y[start:start + chunk, None] - y[None, :]
+        weight = k2 / (dx * dx + dy * dy + 1e-9)
+        disp[start:start + chunk, 0] = (dx * weight).sum(1)
+        disp[start:start + chunk, 1] = (dy * weight).sum(1)
+    return disp
+
+
+def _grid_repulsion(pos, k2, cells, chunk=8192):
+    # Every node is pushed by the mass at each occupied cell's centroid, so a
+    # step costs O(nodes * cells) instead of O(nodes^2).
+    lo, hi = pos.min(0), pos.max(0)
+    span = np.maximum(hi - lo, 1e-9)
+    cell = np.minimum(((pos - lo) / span * cells).astype(np.int64), cells - 1)
+    cell_id = cell[:, 0] * cells + cell[:, 1]
+    mass = np.bincount(cell_id, minlength=cells * cells).astype(float)
+    occupied = np.flatnonzero(mass)
+    mass = mass[occupied]
+    cx = np.bincount(cell_id, weights=pos[:, 0], minlength=cells * cells)[occupied] / mass
+    cy = np.bincount(cell_id, weights=pos[:, 1], minlength=cells * cells)[occupied] / mass
+    # Softening of about one cell keeps a node's own cell from blowing up
+    soft = (span / cells).mean() ** 2
+    x, y = pos[:, 0], pos[:, 1]
+    disp = np.zeros_like(pos)
+    for start in range(0, len(pos), chunk):
+        dx = x[start:start + chunk, None] - cx[None, :]
+        dy = y[start:start + chunk, None] - cy[None, :]
+        weight = mass * k2 / (dx * dx + dy * dy + soft)
+        disp[start:start + chunk, 0] = (dx * weight).sum(1)
+        disp[start:start + chunk, 1] = (dy * weight).sum(1)
+    return disp
+
+
+def force_layout(n_nodes, edge_a, edge_b, groups, iterations=150, seed=0, class_gravity=0.05, initial=None):
+    """Spring embedder over integer edge arrays; nodes with the same `groups`
+    code (>= 0) are pulled towards their group's centroid.
+
+    `initial` (n x 2, NaN rows for new nodes) warm-starts from an earlier
+    layout: known nodes start where they were and the system starts cooler.
+    """
+    if n_nodes == 0:
+        return np.zeros(0), np.zeros(0)
+    rng = np.random.default_rng(seed)
+    groups = np.asarray(groups)
+    n_groups = int(groups.max()) + 1 if len(groups) else 0
+    k = 1.0
+    k2 = k * k
+    scale = np.sqrt(n_nodes) * k
+
+    # Start each class in its own sector; ungrouped nodes (hubs) near the centre
+    sector = np.where(groups >= 0, groups, 0) + rng.random(n_nodes) * 0.8
+    angle = 2 * np.pi * sector / max(n_groups, 1)
+    radius = np.where(groups >= 0, scale * (0.5 + 0.5 * rng.random(n_nodes)), scale * 0.05)
+    pos = np.stack([radius * np.cos(angle), radius * np.sin(angle)], axis=1)
+    temperature = scale * 0.1
+    if initial is not None:
+        known = ~np.isnan(initial).any(axis=1)
+        pos[known] = initial[known]
+        # New nodes start beside their class's known members
+        for g in np.unique(groups[~known]):
+            members = known & (groups == g)
+            if members.any():
+                fresh = ~known & (groups == g)
+                pos[fresh] = pos[members].mean(0) + rng.normal(0, k, (fresh.sum(), 2))
+        temperature = scale * 0.02
+
+    cells = min(16, max(4, int(np.sqrt(n_nodes) / 8)))
+    cooling = (scale * 0.01 / temperature) ** (1 / max(iterations, 1))
+    for _ in range(iterations):
+        if n_nodes <= EXACT_LIMIT:
+            disp = _exact_repulsion(pos, k2)
+        else:
+            disp = _grid_repulsion(pos, k2, cells)
+
+        if len(edge_a):
+            delta = pos[edge_a] - pos[edge_b]
+            dist = np.sqrt((delta ** 2).sum(1)) + 1e-9
+            pull = delta * (dist / k)[:, None]
+            for d in range(2):
+                disp[:, d] -= np.bincount(edge_a, weights=pull[:, d], minlength=n_nodes)
+                disp[:, d] += np.bincount(edge_b, weights=pull[:, d], minlength=n_nodes)
+
+        if n_groups:
+            grouped = groups >= 0
+            counts = np.bincount(groups[grouped], minlength=n_groups)
+            centroid = np.stack([
+                np.bincount(groups[grouped], weights=pos[grouped, d], minlength=n_groups)
+                / np.maximum(counts, 1)
+                for d in range(2)
+            ], axis=1)
+            disp[grouped] -= (pos[grouped] - centroid[groups[grouped]]) * class_gravity * scale
+
+        length = np.sqrt((disp ** 2).sum(1)) + 1e-9
+        pos += disp / length[:, None] * np.minimum(length, temperature)[:, None]
+        temperature *= cooling
+
+    pos -= pos.mean(0)
+    return pos[:, 0], pos[:, 1]
+
+
+# --- Graph layouts persisted per dataset version ---
+def layout_key(content_hash, selected_classes, **params):
+    payload = json.dumps({
+        "data": content_hash,
+        "classes": sorted(map(str, selected_classes)),
+        "version": LAYOUT_VERSION,
+        "params": params,
+    }, sort_keys=True)
+    digest = hashlib.sha256(payload.encode()).hexdigest()[:24]
+    # The data hash leads the file name, so layouts of replaced data can be pruned
+    return f"{content_hash[:12]}-{digest}" if content_hash else digest
+
+
+def layout_path(key, layout_dir=LAYOUT_DIR):
+    return os.path.join(layout_dir, f"{key}.npz")
+
+
+def layout_exists(key, layout_dir=LAYOUT_DIR):
+    return os.path.exists(layout_path(key, layout_dir))
+
+
+def prune_layouts(layout_dir, key):
+    # Remove layouts of other data versions than `key`'s. Those a warm-start
+    # pointer still names are kept until their filter is laid out again.
+    generation, sep, _ = key.partition("-")
+    if not sep:
+        return
+    try:
+        names = os.listdir(layout_dir)
+    except OSError:
+        return
+    keep = set()
+    for name in names:
+        if name.startswith("latest-") and name.endswith(".txt"):
+            try:
+                with open(os.path.join(layout_dir, name)) as f:
+                    keep.add(f.read().strip())
+            except OSError:
+                pass
+    for name in names:
+        if name.endswith(".npz") and not name.startswith(generation + "-") and name[:-4] not in keep:
+            try:
+                os.remove(os.path.join(layout_dir, name))
+            except OSError:
+                pass
+
+
+def graph_layout(graph, node_classes, iterations=None, seed=0, initial=None):
+    # Force-directed coordinates for every node of an HGTGraph, scaled to the
+    # extent of the default ring so node and font sizes read the same. Returns
+    # (x, y, factor); dividing by `factor` gives back the embedder's units.
+    if iterations is None:
+        iterations = 150 if graph.n_nodes <= EXACT_LIMIT else 60
+        if initial is not None:
+            iterations //= 3
+    hub_of_edge = graph.hub_ids[graph.edge_hubs()]
+    x, y = force_layout(graph.n_nodes, graph.indices, hub_of_edge, node_classes,
+                        iterations=iterations, seed=seed, initial=initial)
+    extent = np.sqrt(x ** 2 + y ** 2).max(initial=0)
+    factor = (400 + 2 * graph.n_edges) / extent if extent > 0 else 1.0
+    return x * factor, y * factor, factor
+
+
+def load_layout(path):
+    with np.load(path, allow_pickle=False) as data:
+        return data["names"], data["x"], data["y"], float(data["factor"])
+
+
+def warm_start(graph, layout_dir, warm_key):
+    # Positions from the last layout computed for the same filter, if any,
+    # aligned with this graph's nodes (NaN for nodes it did not have)
+    pointer = os.path.join(layout_dir, f"latest-{warm_key}.txt")
+    try:
+        with open(pointer) as f:
+            names, x, y, factor = load_layout(layout_path(f.read().strip(), layout_dir))
+    except (OSError, ValueError, KeyError):
+        return None
+    pos = pd.Index(names).get_indexer(graph.names.astype(str))
+    initial = np.full((graph.n_nodes, 2), np.nan)
+    known = pos >= 0
+    initial[known, 0] = x[pos[known]] / factor
+    initial[known, 1] = y[pos[known]] / factor
+    return initial if known.any() else None
+
+
+def cached_graph_layout(graph, node_classes, key, layout_dir=LAYOUT_DIR, warm_key=None, **params):
+    path = layout_path(key, layout_dir)
+    names = graph.names.astype(str)
+    if os.path.exists(path):
+        try:
+            cached_names, x, y, _ = load_layout(path)
+            if np.array_equal(cached_names, names):
+                return x, y
+        except (OSError, ValueError, KeyError):
+            pass
+    initial = warm_start(graph, layout_dir, warm_key) if warm_key else None
+    x, y, factor = graph_layout(graph, node_classes, initial=initial, **params)
+    try:
+        os.makedirs(layout_dir, exist_ok=True)
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, names=names, x=x, y=y, factor=np.array(factor))
+        os.replace(tmp, path)
+        if warm_key:
+            with open(os.path.join(layout_dir, f"latest-{warm_key}.txt"), "w") as f:
+                f.write(key)
+        prune_layouts(layout_dir, key)
+    except OSError:
+        pass
+    return x, y
+
+
+# --- Layouts computed off the request path ---
+class LayoutJobs:
+    """Runs layout computations on a background thread, one per key at a time.
+
+    A page that finds no cached layout submits the work here and draws a
+    stand-in; the result lands in the on-disk cache for a later rerun.
+    """
+
+    def __init__(self, workers=1):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="layout")
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, compute, *args, **kwargs):
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = self._executor.submit(self._run, key, compute, args, kwargs)
+        return future
+
+    def pending(self, key):
+        with self._lock:
+            return key in self._pending
+
+    def _run(self, key, compute, args, kwargs):
+        try:
+            return compute(*args, **kwargs)
+        except Exception:
+            logger.exception("Layout %s failed", key)
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_layout_jobs():
+    return LayoutJobs()
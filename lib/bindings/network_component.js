@@ -0,0 +1,153 @@
+// Streamlit component that keeps one vis.js network alive in the browser.
+// The full graph is sent once per data version; later renders only carry the
+// highlight set, style parameters and hidden classes, which are diffed here
+// and applied to the changed nodes/edges through DataSet.update.
+(function () {
+  var container = document.getElementById("mynetwork");
+  var network = null;
+  var nodes = null;
+  var edges = null;
+  var version = null;
+  var hubIds = [];
+  var classNodes = {};
+  var nodeEdges = {};
+  var highlighted = new Set();
+  var hiddenClasses = new Set();
+  var style = {};
+
+  function send(type, data) {
+    var message = Object.assign({ isStreamlitMessage: true, type: type }, data || {});
+    window.parent.postMessage(message, "*");
+  }
+
+  function setValue(value) {
+    send("streamlit:setComponentValue", { value: value, dataType: "json" });
+  }
+
+  function loadGraph(graph) {
+    if (network) {
+      network.destroy();
+    }
+    nodes = new vis.DataSet(graph.nodes);
+    edges = new vis.DataSet(graph.edges);
+    hubIds = graph.hubs;
+    classNodes = {};
+    nodeEdges = {};
+    graph.nodes.forEach(function (node) {
+      if (node.cls !== undefined && node.cls !== null) {
+        (classNodes[node.cls] = classNodes[node.cls] || []).push(node.id);
+      }
+    });
+    // Satellite -> its edges (one per target hub)
+    graph.edges.forEach(function (edge) {
+      (nodeEdges[edge.from] = nodeEdges[edge.from] || []).push(edge.id);
+    });
+    highlighted = new Set();
+    hiddenClasses = new Set();
+    style = {};
+    network = new vis.Network(container, { nodes: nodes, edges: edges }, graph.options);
+    version = graph.version;
+  }
+
+  function applyStyle(next) {
+    if (next.image_size !== style.image_size || next.font_size !== style.font_size ||
+        next.connection_width !== style.connection_width) {
+      network.setOptions({
+        nodes: { size: next.image_size, font: { size: next.font_size } },
+        edges: { width: next.connection_width }
+      });
+      nodes.update(hubIds.map(function (id) { return { id: id, size: next.image_size }; }));
+      // Highlighted edges carry an explicit width that tracks Connection Width
+      var widths = [];
+      highlighted.forEach(function (id) {
+        nodeEdges[id].forEach(function (edgeId) {
+          widths.push({ id: edgeId, width: next.connection_width * 2 });
+        });
+      });
+      edges.update(widths);
+    }
+    if (next.bg_color !== style.bg_color) {
+      container.style.backgroundColor = next.bg_color;
+    }
+    style = next;
+  }
+
+  function applyHighlight(ids) {
+    var next = new Set(ids);
+    var nodeUpdates = [];
+    var edgeUpdates = [];
+    highlighted.forEach(function (id) {
+      if (!next.has(id)) {
+        // null falls back to the global node/edge options
+        nodeUpdates.push({ id: id, borderWidth: null });
+        nodeEdges[id].forEach(function (edgeId) {
+          edgeUpdates.push({ id: edgeId, color: null, width: null });
+        });
+      }
+    });
+    next.forEach(function (id) {
+      if (!highlighted.has(id) && nodeEdges[id]) {
+        nodeUpdates.push({ id: id, borderWidth: 4 });
+        nodeEdges[id].forEach(function (edgeId) {
+          edgeUpdates.push({ id: edgeId, color: "#FFD700", width: style.connection_width * 2 });
+        });
+      }
+    });
+    nodes.update(nodeUpdates);
+    edges.update(edgeUpdates);
+    // Only satellites have edges; hubs and unknown ids are ignored
+    highlighted = new Set(Array.from(next).filter(function (id) { return nodeEdges[id] !== undefined; }));
+  }
+
+  function applyVisibility(classes) {
+    var next = new Set(classes);
+    var changed = [];
+    Object.keys(classNodes).forEach(function (cls) {
+      if (next.has(cls) !== hiddenClasses.has(cls)) {
+        changed.push(cls);
+      }
+    });
+    var nodeUpdates = [];
+    var edgeUpdates = [];
+    changed.forEach(function (cls) {
+      var hidden = next.has(cls);
+      classNodes[cls].forEach(function (id) {
+        nodeUpdates.push({ id: id, hidden: hidden });
+        (nodeEdges[id] || []).forEach(function (edgeId) {
+          edgeUpdates.push({ id: edgeId, hidden: hidden });
+        });
+      });
+    });
+    nodes.update(nodeUpdates);
+    edges.update(edgeUpdates);
+    hiddenClasses = next;
+  }
+
+  function onRender(args) {
+    if (container.style.height !== args.height + "px") {
+      container.style.height = args.height + "px";
+      send("streamlit:setFrameHeight", { height: args.height + 10 });
+    }
+    if (args.graph) {
+      loadGraph(args.graph);
+    } else if (!network || version !== args.version) {
+      // Iframe was remounted or the data changed: ask Python for the graph
+      setValue({ version: null, requested: Date.now() });
+      return;
+    }
+    applyStyle(args.style);
+    applyHighlight(args.highlight);
+    applyVisibility(args.hidden_classes);
+    if (args.graph) {
+      setValue({ version: version });
+    }
+  }
+
+  window.addEventListener("message", function (event) {
+    if (event.data && event.data.type === "streamlit:render") {
+      onRender(event.data.args);
+    }
+  });
+
+  send("streamlit:componentReady", { apiVersion: 1 });
+})();
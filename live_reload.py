@@ -0,0 +1,196 @@
+import io
+import logging
+import os
+import threading
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+import streamlit as st
+from node_store import (DATA_FILE, GENE_TABLE_FILE, NodeStore, data_version, load_edge_store,
+                        load_gene_table, load_node_store, prepare_edge_table, sha256_prefix)
+
+POLL_INTERVAL = 5.0
+logger = logging.getLogger(__name__)
+
+# Rows in the new table that the old one lacked, and the reverse; `appended`
+# when the file only grew, so old row positions are unchanged.
+TableDiff = namedtuple("TableDiff", "added removed appended")
+
+
+# --- Row-level diff ---
+def row_hashes(df):
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def diff_rows(old, new):
+    # Rows compared by content hash; a repeated row counts as one
+    old_hashes, new_hashes = row_hashes(old), row_hashes(new)
+    added = new.iloc[np.flatnonzero(~np.isin(new_hashes, old_hashes))]
+    removed = old.iloc[np.flatnonzero(~np.isin(old_hashes, new_hashes))]
+    return TableDiff(added, removed, False)
+
+
+def appended_offset(store, path=DATA_FILE):
+    # (byte offset of the new rows, SHA-256 state of the old content) when the
+    # file is the old content plus whole lines at the end; None for any other
+    # kind of change
+    old_version = store.version.split("|")[0]
+    if old_version == "-" or store.content_hash.startswith("version:"):
+        return None
+    old_size = int(old_version.split(":")[1])
+    if not os.path.exists(path) or os.path.getsize(path) <= old_size or old_size == 0:
+        return None
+    with open(path, "rb") as f:
+        f.seek(old_size - 1)
+        if f.read(1) != b"\n":
+            return None
+    digest = sha256_prefix(path, old_size)
+    if digest.hexdigest() != store.content_hash:
+        return None
+    return old_size, digest
+
+
+def read_appended(path, offset, size, columns, digest):
+    # New rows between `offset` and `size` (the size in the new version
+    # stamp), and the new content hash from the old content's hash state
+    with open(path, "rb") as f:
+        f.seek(offset)
+        tail = f.read(size - offset)
+    digest.update(tail)
+    rows = pd.read_csv(io.BytesIO(tail), sep="\t", header=None, names=columns)
+    return prepare_edge_table(rows), digest.hexdigest()
+
+
+# --- Live store ---
+class LiveData:
+    """The current NodeStore, swapped in place when file.txt or the protein
+    table change on disk.
+
+    A poller thread compares file versions every `interval` seconds. Pure
+    appends only parse the new lines and extend the existing store; other
+    edits reload and diff row by row. Every new store carries its content
+    hash, carried on from the old one for an append, so the next append is
+    recognised too. Values registered with `derive` are brought up to date
+    before the new store becomes visible, so sessions never see a store
+    without its palette, indexes or layouts.
+    """
+
+    def __init__(self, store, interval=POLL_INTERVAL):
+        self.store = store
+        self.interval = interval
+        self.generation = 0
+        self.last_diff = None
+        self._derived = []
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # Derived values and listeners
+    def derive(self, build, update=None):
+        derived = Derived(self, build, update)
+        with self._lock:
+            self._derived.append(derived)
+        return derived
+
+    def subscribe(self, listener):
+        # listener(old_store, new_store, diff), called before the swap
+        with self._lock:
+            self._listeners.append(listener)
+
+    # Polling
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="live-reload", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        # Hash the loaded file up front, so a later append can be recognised
+        self.store.content_hash
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Reloading data failed; keeping the current store")
+
+    def check(self):
+        version = data_version(DATA_FILE, GENE_TABLE_FILE)
+        if version == self.store.version:
+            return None
+        return self.reload(version)
+
+    def reload(self, version):
+        with self._lock:
+            old = self.store
+            old_edges_version, old_genes_version = old.version.split("|")
+            edges_version, genes_version = version.split("|")
+            genes = old.genes if genes_version == old_genes_version else load_gene_table()
+            appended = appended_offset(old) if edges_version != old_edges_version else None
+            if edges_version == old_edges_version:
+                new = NodeStore(old.edges, genes, version, old.node_index, old.class_stats, old.content_hash)
+                diff = TableDiff(old.edges.iloc[0:0], old.edges.iloc[0:0], True)
+            elif appended is not None:
+                offset, digest = appended
+                size = int(edges_version.split(":")[1])
+                rows, content_hash = read_appended(DATA_FILE, offset, size, list(old.edges.columns), digest)
+                new = old.appended(rows, genes, version, content_hash)
+                diff = TableDiff(rows, old.edges.iloc[0:0], True)
+            else:
+                edges, node_index, class_stats = load_edge_store()
+                new = NodeStore(edges, genes, version, node_index, class_stats)
+                new.content_hash  # hashed here, off the request path
+                diff = diff_rows(old.edges, edges) if old.edges is not None and edges is not None else None
+            for derived in self._derived:
+                derived.refresh(old, new, diff)
+            for listener in self._listeners:
+                listener(old, new, diff)
+            self.store = new
+            self.last_diff = diff
+            self.generation += 1
+        logger.info("Reloaded data: %s rows added, %s removed",
+                    len(diff.added) if diff else "?", len(diff.removed) if diff else "?")
+        return diff
+
+
+class Derived:
+    """A value computed from the live store, kept current across reloads.
+
+    `update(value, old_store, new_store, diff)` may patch the old value for a
+    diff and return it; returning None (or having no `update`) rebuilds it.
+    """
+
+    def __init__(self, live, build, update=None):
+        self.live = live
+        self.build = build
+        self.update = update
+        self._value = None
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        store = self.live.store
+        with self._lock:
+            if self._version != store.version:
+                self._value = self.build(store)
+                self._version = store.version
+            return self._value
+
+    def refresh(self, old, new, diff):
+        with self._lock:
+            if self._version is None:
+                return  # never used, so build lazily on first get()
+            value = None
+            if self.update is not None and diff is not None and self._version == old.version:
+                value = self.update(self._value, old, new, diff)
+            self._value = value if value is not None else self.build(new)
+            self._version = new.version
+
+
+@st.cache_resource(show_spinner=False)
+def get_live_data():
+    # One watcher per process, seeded with the store loaded at startup
+    return LiveData(load_node_store()).start()
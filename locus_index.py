@@ -0,0 +1,194 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+import streamlit as st
+from live_reload import get_live_data
+from table_cache import CACHE_DIR
+
+LOCUS_INDEX_FILE = os.path.join(CACHE_DIR, "locus_index.npz")
+_STRANDS = {"+": 1, "-": -1}
+
+
+# --- Locus index for HGT candidates ---
+class LocusIndex:
+    """Locus tag -> (accession, begin, end, strand) for every `source`, plus
+    per-chromosome interval arrays for window and nearest-neighbour queries."""
+
+    def __init__(self, tags, chroms, chrom_codes, begins, ends, strands, version=""):
+        # Rows are sorted by (chromosome, begin); coordinates are 1-based inclusive
+        self.tags = tags
+        self.chroms = chroms
+        self.chrom_codes = chrom_codes
+        self.begins = begins
+        self.ends = ends
+        self.strands = strands
+        self.version = version
+        self._positions = {tag: i for i, tag in enumerate(tags.tolist())}
+        self._chrom_ids = {chrom: i for i, chrom in enumerate(chroms.tolist())}
+        self.offsets = np.searchsorted(chrom_codes, np.arange(len(chroms) + 1))
+        # Per chromosome: longest interval (bounds the overlap search) and the
+        # row order by end coordinate (for left-hand neighbours)
+        self._max_len = np.zeros(len(chroms), dtype=np.int64)
+        self._end_order = []
+        for c in range(len(chroms)):
+            lo, hi = self.offsets[c], self.offsets[c + 1]
+            if hi > lo:
+                self._max_len[c] = (ends[lo:hi] - begins[lo:hi]).max()
+            self._end_order.append(np.argsort(ends[lo:hi], kind="stable"))
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __contains__(self, tag):
+        return tag in self._positions
+
+    @classmethod
+    def build(cls, edges, genes, version=""):
+        if genes.empty or edges is None or not {"Locus tag", "Accession", "Begin", "End"}.issubset(genes.columns):
+            return cls.empty(version)
+        rows = genes.drop_duplicates("Locus tag")
+        rows = rows[rows["Locus tag"].isin(pd.unique(edges["source"]))]
+        chrom_cat = pd.Categorical(rows["Accession"].astype(str))
+        codes = chrom_cat.codes.astype(np.int32)
+        begins = rows["Begin"].to_numpy(dtype=np.int64)
+        ends = rows["End"].to_numpy(dtype=np.int64)
+        if "Strand" in rows.columns:
+            strands = rows["Strand"].astype(object).map(_STRANDS).fillna(0).to_numpy(dtype=np.int8)
+        else:
+            strands = np.zeros(len(rows), dtype=np.int8)
+        order = np.lexsort((begins, codes))
+        return cls(
+            rows["Locus tag"].astype(str).to_numpy()[order].astype(str),
+            np.asarray(chrom_cat.categories, dtype=str),
+            codes[order], begins[order], ends[order], strands[order], version,
+        )
+
+    def extended(self, rows, genes, version=""):
+        # This index plus the sources in `rows` (appended edge rows) it lacks
+        sources = pd.unique(rows["source"])
+        if not genes.empty and "Locus tag" in genes.columns:
+            genes = genes[genes["Locus tag"].isin(sources).to_numpy()]
+        added = LocusIndex.build(rows, genes, version)
+        fresh = ~np.isin(added.tags, self.tags)
+        chroms = np.union1d(self.chroms, added.chroms)
+        codes = np.concatenate([np.searchsorted(chroms, self.chroms)[self.chrom_codes],
+                                np.searchsorted(chroms, added.chroms)[added.chrom_codes[fresh]]])
+        tags = np.concatenate([self.tags, added.tags[fresh]])
+        begins = np.concatenate([self.begins, added.begins[fresh]])
+        ends = np.concatenate([self.ends, added.ends[fresh]])
+        strands = np.concatenate([self.strands, added.strands[fresh]])
+        order = np.lexsort((begins, codes))
+        return LocusIndex(tags[order], chroms, codes[order].astype(np.int32), begins[order], ends[order],
+                          strands[order], version)
+
+    @classmethod
+    def empty(cls, version=""):
+        return cls(np.array([], dtype=str), np.array([], dtype=str), np.array([], dtype=np.int32),
+                   np.array([], dtype=np.int64), np.array([], dtype=np.int64),
+                   np.array([], dtype=np.int8), version)
+
+    # On-disk form
+    def save(self, path=LOCUS_INDEX_FILE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, tags=self.tags, chroms=self.chroms, chrom_codes=self.chrom_codes,
+                 begins=self.begins, ends=self.ends, strands=self.strands,
+                 meta=np.array(json.dumps({"version": self.version})))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=LOCUS_INDEX_FILE):
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            return cls(data["tags"], data["chroms"], data["chrom_codes"], data["begins"],
+                       data["ends"], data["strands"], meta["version"])
+
+    # Point lookups
+    def locus(self, tag):
+        i = self._positions.get(tag)
+        if i is None:
+            return None
+        return (str(self.chroms[self.chrom_codes[i]]), int(self.begins[i]),
+                int(self.ends[i]), int(self.strands[i]))
+
+    def locus_string(self, tag):
+        locus = self.locus(tag)
+        return f"{locus[0]}:{locus[1]}-{locus[2]}" if locus else ""
+
+    # Window queries
+    def _chrom_slice(self, chrom):
+        c = self._chrom_ids.get(chrom)
+        if c is None:
+            return None, 0, 0
+        return c, self.offsets[c], self.offsets[c + 1]
+
+    def overlapping(self, chrom, start, end):
+        # Rows whose interval overlaps [start, end]
+        c, lo, hi = self._chrom_slice(chrom)
+        if c is None:
+            return np.array([], dtype=np.int64)
+        begins = self.begins[lo:hi]
+        left = np.searchsorted(begins, start - self._max_len[c], side="left")
+        right = np.searchsorted(begins, end, side="right")
+        rows = np.arange(lo + left, lo + right)
+        return rows[self.ends[rows] >= start]
+
+    def nearest(self, chrom, pos, k=5):
+        # k rows closest to `pos` (distance 0 when the interval contains it)
+        c, lo, hi = self._chrom_slice(chrom)
+        if c is None or k <= 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        contains = self.overlapping(chrom, pos, pos)
+        # Right of pos: smallest begins > pos
+        r = lo + np.searchsorted(self.begins[lo:hi], pos, side="right")
+        right = np.arange(r, min(r + k, hi))
+        # Left of pos: largest ends < pos
+        end_order = self._end_order[c]
+        l = np.searchsorted(self.ends[lo:hi][end_order], pos, side="left")
+        left = lo + end_order[max(l - k, 0):l]
+        rows = np.unique(np.concatenate([contains, right, left]))
+        dist = np.maximum(np.maximum(self.begins[rows] - pos, pos - self.ends[rows]), 0)
+        order = np.lexsort((self.begins[rows], dist))[:k]
+        return rows[order], dist[order]
+
+    def tags_at(self, rows):
+        return self.tags[rows].tolist()
+
+
+def load_locus_index(store, path=LOCUS_INDEX_FILE):
+    # Reuse the on-disk index while the source tables are unchanged
+    if os.path.exists(path):
+        try:
+            index = LocusIndex.load(path)
+            if index.version == store.version:
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+    index = LocusIndex.build(store.edges, store.genes, store.version)
+    try:
+        index.save(path)
+    except OSError:
+        pass
+    return index
+
+
+def extend_locus_index(index, old, new, diff, path=LOCUS_INDEX_FILE):
+    # Appended rows with an unchanged protein table only add loci; anything else rebuilds
+    if not diff.appended or new.genes is not old.genes:
+        return None
+    index = index.extended(diff.added, new.genes, new.version)
+    try:
+        index.save(path)
+    except OSError:
+        pass
+    return index
+
+
+@st.cache_resource(show_spinner=False)
+def live_locus_index():
+    return get_live_data().derive(load_locus_index, extend_locus_index)
+
+
+def get_locus_index():
+    return live_locus_index().get()
@@ -0,0 +1,176 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+import pandas as pd
+import streamlit as st
+
+logger = logging.getLogger("hgt.metrics")
+# One JSON line per rerun is opt-in: HGT_METRICS_LOG_LEVEL=INFO (or DEBUG)
+# sends them to stderr. Streamlit does not configure this logger, so without
+# the variable it stays quiet in normal use.
+_LOG_LEVEL = os.environ.get("HGT_METRICS_LOG_LEVEL")
+if _LOG_LEVEL and not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(name)s: %(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+    logger.setLevel(_LOG_LEVEL.upper())
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def format_labels(key, **extra):
+    items = list(key) + sorted(extra.items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in items) + "}"
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# --- Process-wide registry ---
+class Metrics:
+    """Counters and latency histograms shared by every page and the file server.
+
+    Cache statistics are pulled at export time from the collectors passed to
+    `register`, so the caches keep their own counters. The Prometheus text is
+    served at /metrics by the igv.js file server, not by Streamlit: its port
+    is random unless FILE_SERVER_PORT is set, and a scraper outside the host
+    also needs that port exposed (render.yml only exposes $PORT).
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._counters = defaultdict(float)
+        self._histograms = {}
+        self._collectors = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, **labels):
+        with self._lock:
+            self._counters[name, label_key(labels)] += value
+
+    def observe(self, name, seconds, **labels):
+        with self._lock:
+            hist = self._histograms.get((name, label_key(labels)))
+            if hist is None:
+                hist = self._histograms[name, label_key(labels)] = [0, 0.0, [0] * len(self.buckets)]
+            hist[0] += 1
+            hist[1] += seconds
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    hist[2][i] += 1
+
+    def register(self, prefix, collect):
+        # collect() -> {name: value}, exported as <prefix>_<name>
+        with self._lock:
+            self._collectors[prefix] = collect
+
+    def counters(self):
+        with self._lock:
+            values = dict(self._counters)
+            collectors = list(self._collectors.items())
+        for prefix, collect in collectors:
+            for name, value in collect().items():
+                values[f"{prefix}_{name}", ()] = value
+        return values
+
+    def prometheus_text(self):
+        lines = []
+        for (name, key), value in sorted(self.counters().items()):
+            lines.append(f"hgt_{name}{format_labels(key)} {value:g}")
+        with self._lock:
+            histograms = sorted((key, (h[0], h[1], list(h[2]))) for key, h in self._histograms.items())
+        typed = set()
+        for (name, key), (count, total, buckets) in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE hgt_{name} histogram")
+                typed.add(name)
+            for bound, n in zip(self.buckets, buckets):
+                lines.append(f"hgt_{name}_bucket{format_labels(key, le=bound)} {n}")
+            lines.append(f"hgt_{name}_bucket{format_labels(key, le='+Inf')} {count}")
+            lines.append(f"hgt_{name}_sum{format_labels(key)} {total:.6f}")
+            lines.append(f"hgt_{name}_count{format_labels(key)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+@st.cache_resource(show_spinner=False)
+def get_metrics():
+    return Metrics()
+
+
+# --- Per-rerun trace ---
+class RerunTrace:
+    """Stage timings and counters for one script run of one page.
+
+    Every span and count also goes into the process-wide registry; `finish`
+    writes the run as one JSON log line.
+    """
+
+    def __init__(self, page, metrics=None):
+        self.page = page
+        self.metrics = metrics if metrics is not None else get_metrics()
+        self.spans = []
+        self.counts = defaultdict(int)
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def span(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.spans.append((stage, seconds))
+            self.metrics.observe("stage_seconds", seconds, page=self.page, stage=stage)
+
+    def count(self, name, value=1):
+        self.counts[name] += value
+        self.metrics.inc(f"{name}_total", value, page=self.page)
+
+    def finish(self):
+        total = time.perf_counter() - self.start
+        self.metrics.observe("rerun_seconds", total, page=self.page)
+        logger.info(json.dumps({"event": "rerun", "page": self.page, "seconds": round(total, 6),
+                                "spans": {stage: round(s, 6) for stage, s in self.spans},
+                                "counts": dict(self.counts)}))
+        return total
+
+
+def debug_enabled():
+    # Toggled from the main page sidebar; ?debug=1 works on any page
+    return bool(st.session_state.get("show_debug")) or st.query_params.get("debug") == "1"
+
+
+def debug_panel(trace, metrics_url=""):
+    """Sidebar expander with this run's stages and the process-wide counters."""
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        total = time.perf_counter() - trace.start
+        spans = pd.DataFrame(trace.spans, columns=["Stage", "Seconds"])
+        st.caption(f"This run: {total * 1000:.1f} ms")
+        st.dataframe(spans.style.format({"Seconds": "{:.4f}"}), hide_index=True, use_container_width=True)
+        if trace.counts:
+            st.write({name: int(value) for name, value in trace.counts.items()})
+        counters = trace.metrics.counters()
+        for prefix in ("render_cache", "detail_cache", "region_cache", "block_cache"):
+            hits, misses = counters.get((f"{prefix}_hits", ()), 0), counters.get((f"{prefix}_misses", ()), 0)
+            if hits + misses:
+                st.caption(f"{prefix.replace('_', ' ').capitalize()}: {hits / (hits + misses):.0%} hits "
+                           f"({int(hits):,} / {int(hits + misses):,})")
+        requests = sum(v for (name, _), v in counters.items() if name == "file_server_requests_total")
+        if requests:
+            sent = sum(v for (name, _), v in counters.items() if name == "file_server_bytes_total")
+            st.caption(f"File server: {int(requests):,} requests, {sent / 2**20:,.1f} MiB sent")
+        if metrics_url:
+            st.caption(f"Prometheus metrics: {metrics_url} (file server port; set FILE_SERVER_PORT "
+                       "and expose it for an external scraper)")
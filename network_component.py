@@ -0,0 +1,33 @@
+import os
+import streamlit as st
+import streamlit.components.v1 as components
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib")
+
+# lib/index.html + lib/bindings/network_component.js, next to the bundled vis-9.1.2
+_network_component = components.declare_component("hgt_network", path=LIB_DIR)
+
+
+def network_view(graph_version, build_graph, highlight_nodes, image_size, font_size,
+                 connection_width, bg_color, hidden_classes, height=750, key="hgt_network"):
+    # The component reports the graph version it holds; the full graph is only
+    # sent when that differs, every other rerun carries just the small deltas.
+    loaded = st.session_state.get(key)
+    loaded_version = loaded.get("version") if isinstance(loaded, dict) else None
+    graph = build_graph() if loaded_version != graph_version else None
+
+    return _network_component(
+        version=graph_version,
+        graph=graph,
+        highlight=sorted(highlight_nodes),
+        style={
+            "image_size": image_size,
+            "font_size": font_size,
+            "connection_width": connection_width,
+            "bg_color": bg_color,
+        },
+        hidden_classes=sorted(hidden_classes),
+        height=height,
+        key=key,
+        default=None,
+    )
@@ -0,0 +1,279 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+import streamlit as st
+from graph_builder import UNCLASSIFIED
+from live_reload import get_live_data
+from locus_index import LocusIndex, load_locus_index
+from search_index import field_postings
+from table_cache import CACHE_DIR
+
+ANALYTICS_FILE = os.path.join(CACHE_DIR, "node_analytics.npz")
+NEIGHBOUR_WINDOW = 20_000  # bp between two candidates' intervals
+MAX_NEIGHBOURS = 25
+CLUSTER_GAP = 10_000  # bp; closer consecutive candidates share an HGT cluster
+TOP_SIMILAR = 10
+DF_CAP = 200  # tokens in more descriptions than this add no similarity pairs
+BLOCK_PAIRS = 4_000_000
+
+
+# --- Batch helpers ---
+def csr(groups, n_groups, *values):
+    # Group ids -> (indptr, values sorted by group, stable within a group)
+    order = np.argsort(groups, kind="stable")
+    indptr = np.searchsorted(groups[order], np.arange(n_groups + 1))
+    return (indptr,) + tuple(v[order] for v in values)
+
+
+def top_k_per_group(groups, others, scores, k, descending=True):
+    # Keep the k best (group, other) pairs per group, ordered by group then score
+    order = np.lexsort((others, -scores if descending else scores, groups))
+    groups, others, scores = groups[order], others[order], scores[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(groups) else np.array([], dtype=np.int64)
+    rank = np.arange(len(groups)) - np.repeat(starts, np.diff(np.r_[starts, len(groups)]))
+    keep = rank < k
+    return groups[keep], others[keep], scores[keep]
+
+
+def window_pairs(chrom_codes, begins, ends, window):
+    # All (i, j) with i before j on a chromosome and a gap of at most `window`;
+    # rows must be sorted by (chromosome, begin)
+    if not len(begins):
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
+    # Sort key that never crosses chromosomes: begin offset by chromosome
+    span = int(max(ends.max(), begins.max())) + window + 1
+    key = chrom_codes.astype(np.int64) * span + begins
+    hi = np.searchsorted(key, chrom_codes.astype(np.int64) * span + ends + window, side="right")
+    count = np.maximum(hi - np.arange(len(key)) - 1, 0)
+    first = np.repeat(np.arange(len(key)), count)
+    second = first + 1 + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    gap = np.maximum(begins[second] - ends[first], 0)
+    return first, second, gap
+
+
+def genomic_clusters(chrom_codes, begins, ends, gap):
+    # Runs of candidates no further than `gap` apart; -1 for singletons
+    if not len(begins):
+        return np.array([], dtype=np.int32)
+    reach = np.empty(len(ends), dtype=np.int64)
+    for c in np.unique(chrom_codes):
+        rows = np.flatnonzero(chrom_codes == c)
+        reach[rows] = np.maximum.accumulate(ends[rows])
+    new_run = np.r_[True, (chrom_codes[1:] != chrom_codes[:-1]) | (begins[1:] - reach[:-1] > gap)]
+    run = np.cumsum(new_run) - 1
+    sizes = np.bincount(run)
+    keep = sizes[run] > 1
+    ids = np.full(len(run), -1, dtype=np.int32)
+    ids[keep] = pd.factorize(run[keep])[0]
+    return ids
+
+
+def description_similarity(descriptions, k=TOP_SIMILAR, df_cap=DF_CAP, block_pairs=BLOCK_PAIRS):
+    """Top-k cosine neighbours of every description under TF-IDF.
+
+    Scores are accumulated term by term: each token shared by two documents
+    adds the product of their weights. Tokens in more than `df_cap` documents
+    are skipped (they carry little weight and most of the pairs), and
+    documents are processed in blocks of about `block_pairs` pairs so memory
+    stays bounded. Returns (doc, other, score) arrays, best first per doc.
+    """
+    n = len(descriptions)
+    postings = field_postings(descriptions, 1.0)
+    if postings.empty:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=np.float32)
+    counts = postings.groupby(["doc", "token"], sort=True).size()
+    docs = counts.index.get_level_values(0).to_numpy(dtype=np.int64)
+    terms, vocab = pd.factorize(counts.index.get_level_values(1))
+    df = np.bincount(terms, minlength=len(vocab))
+    weights = counts.to_numpy(dtype=np.float64) * np.log(n / df[terms])
+    norms = np.sqrt(np.bincount(docs, weights ** 2, minlength=n))
+    weights = (weights / np.where(norms[docs] > 0, norms[docs], 1)).astype(np.float32)
+
+    # Entries that can pair up, by term (partners) and by doc (blocks)
+    usable = (df[terms] >= 2) & (df[terms] <= df_cap) & (weights > 0)
+    docs, terms, weights = docs[usable], terms[usable], weights[usable]
+    term_ptr, term_docs, term_weights = csr(terms, len(vocab), docs, weights)
+    fan = df[terms]
+    doc_ptr = np.searchsorted(docs, np.arange(n + 1))
+    doc_pairs = np.r_[0, np.cumsum(np.bincount(docs, fan, minlength=n).astype(np.int64))]
+    bounds = np.unique(np.r_[np.searchsorted(doc_pairs, np.arange(0, doc_pairs[-1], block_pairs), side="right") - 1, n])
+
+    parts = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        s, e = doc_ptr[lo], doc_ptr[hi]
+        if s == e:
+            continue
+        block_fan = fan[s:e]
+        entry = np.repeat(np.arange(s, e), block_fan)
+        offset = np.arange(len(entry)) - np.repeat(np.cumsum(block_fan) - block_fan, block_fan)
+        partner = term_ptr[terms[entry]] + offset
+        a, b = docs[entry], term_docs[partner]
+        other = a != b
+        key = a[other] * n + b[other]
+        pairs, inverse = np.unique(key, return_inverse=True)
+        scores = np.bincount(inverse, (weights[entry] * term_weights[partner])[other]).astype(np.float32)
+        parts.append(top_k_per_group(pairs // n, pairs % n, scores, k))
+    if not parts:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=np.float32)
+    return tuple(np.concatenate(p) for p in zip(*parts))
+
+
+# --- Precomputed analytics ---
+class NodeAnalytics:
+    """Per-node related sets for the detail page, computed in one batch.
+
+    Every relation is a CSR array pair over node ids (first-row order of the
+    edge table), so a page view is a dictionary lookup plus array slices:
+    same-class nodes, HGT candidates within `NEIGHBOUR_WINDOW` bp, the
+    genomic HGT cluster (consecutive candidates at most `CLUSTER_GAP` apart)
+    and the most similar descriptions.
+    """
+
+    ARRAYS = ("nodes", "classes", "class_ptr", "class_members", "neighbour_ptr", "neighbours",
+              "neighbour_gaps", "neighbour_counts", "node_cluster", "cluster_ptr", "cluster_members", "cluster_loci",
+              "similar_ptr", "similar", "similar_scores")
+
+    def __init__(self, version="", **arrays):
+        self.version = version
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        self._positions = {node: i for i, node in enumerate(self.nodes.tolist())}
+        self._class_of = np.empty(len(self.nodes), dtype=np.int64)
+        self._class_of[self.class_members] = np.repeat(np.arange(len(self.classes)), np.diff(self.class_ptr))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        return node in self._positions
+
+    @classmethod
+    def build(cls, edges, genes, version="", locus_index=None, window=NEIGHBOUR_WINDOW,
+              max_neighbours=MAX_NEIGHBOURS, cluster_gap=CLUSTER_GAP, top_similar=TOP_SIMILAR):
+        if edges is None or edges.empty:
+            edges = pd.DataFrame({"source": pd.Series(dtype=object)})
+        first = edges.drop_duplicates("source")
+        nodes = first["source"].astype(str).to_numpy(dtype=str)
+        n = len(nodes)
+        node_ids = pd.Index(nodes)
+
+        labels = first["class"].astype(object).fillna(UNCLASSIFIED) if "class" in first.columns \
+            else pd.Series(UNCLASSIFIED, index=first.index)
+        class_codes, classes = pd.factorize(labels.astype(str).to_numpy(), sort=True)
+        class_ptr, class_members = csr(class_codes, len(classes), np.arange(n))
+
+        # Genomic neighbours and clusters from the (chromosome, begin)-sorted loci
+        if locus_index is None:
+            locus_index = LocusIndex.build(edges, genes, version)
+        loci = node_ids.get_indexer(locus_index.tags.astype(object))
+        first_row, second_row, gaps = window_pairs(locus_index.chrom_codes, locus_index.begins,
+                                                   locus_index.ends, window)
+        a = np.r_[loci[first_row], loci[second_row]]
+        b = np.r_[loci[second_row], loci[first_row]]
+        # Only the closest max_neighbours are listed; the full count is kept apart
+        neighbour_counts = np.bincount(a, minlength=n)
+        a, b, gaps = top_k_per_group(a, b, np.r_[gaps, gaps], max_neighbours, descending=False)
+        neighbour_ptr, neighbours, neighbour_gaps = csr(a, n, b, gaps)
+
+        run = genomic_clusters(locus_index.chrom_codes, locus_index.begins, locus_index.ends, cluster_gap)
+        node_cluster = np.full(n, -1, dtype=np.int32)
+        node_cluster[loci] = run
+        in_run = run >= 0
+        n_clusters = int(run.max()) + 1 if in_run.any() else 0
+        cluster_ptr, cluster_members = csr(run[in_run], n_clusters, loci[in_run])
+        cluster_loci = np.array([
+            f"{locus_index.chroms[locus_index.chrom_codes[rows[0]]]}:"
+            f"{locus_index.begins[rows].min()}-{locus_index.ends[rows].max()}"
+            for rows in np.split(np.flatnonzero(in_run)[np.argsort(run[in_run], kind="stable")],
+                                 cluster_ptr[1:-1])
+        ] if n_clusters else [], dtype=str)
+
+        descriptions = first["description"].to_numpy() if "description" in first.columns else np.full(n, "")
+        doc, other, scores = description_similarity(descriptions, top_similar)
+        similar_ptr, similar, similar_scores = csr(doc, n, other, scores)
+
+        return cls(version, nodes=nodes, classes=np.asarray(classes, dtype=str), class_ptr=class_ptr,
+                   class_members=class_members, neighbour_ptr=neighbour_ptr, neighbours=neighbours,
+                   neighbour_gaps=neighbour_gaps, neighbour_counts=neighbour_counts, node_cluster=node_cluster,
+                   cluster_ptr=cluster_ptr, cluster_members=cluster_members, cluster_loci=cluster_loci,
+                   similar_ptr=similar_ptr, similar=similar, similar_scores=similar_scores)
+
+    # On-disk form
+    def save(self, path=ANALYTICS_FILE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, meta=np.array(json.dumps({"version": self.version})),
+                 **{name: getattr(self, name) for name in self.ARRAYS})
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=ANALYTICS_FILE):
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            return cls(meta["version"], **{name: data[name] for name in cls.ARRAYS})
+
+    # Point lookups
+    def node_summary(self, node, limit=50):
+        """Related nodes of `node` as plain Python data (None if unknown).
+
+        Same-class and cluster member lists are cut to `limit` and genomic
+        neighbours to the closest `MAX_NEIGHBOURS`; their full sizes are in
+        the `*_count` fields.
+        """
+        i = self._positions.get(node)
+        if i is None:
+            return None
+        c = self._class_of[i]
+        same = self.class_members[self.class_ptr[c]:self.class_ptr[c + 1]]
+        same = same[same != i]
+        lo, hi = self.neighbour_ptr[i], self.neighbour_ptr[i + 1]
+        s_lo, s_hi = self.similar_ptr[i], self.similar_ptr[i + 1]
+        cluster = None
+        k = self.node_cluster[i]
+        if k >= 0:
+            members = self.cluster_members[self.cluster_ptr[k]:self.cluster_ptr[k + 1]]
+            cluster = {"id": int(k), "locus": str(self.cluster_loci[k]), "size": len(members),
+                       "members": self.nodes[members[:limit]].tolist()}
+        return {
+            "class": str(self.classes[c]),
+            "same_class_count": len(same),
+            "same_class": self.nodes[same[:limit]].tolist(),
+            "neighbours": list(zip(self.nodes[self.neighbours[lo:hi]].tolist(),
+                                   self.neighbour_gaps[lo:hi].tolist())),
+            "neighbour_count": int(self.neighbour_counts[i]),
+            "cluster": cluster,
+            "similar": list(zip(self.nodes[self.similar[s_lo:s_hi]].tolist(),
+                                self.similar_scores[s_lo:s_hi].tolist())),
+        }
+
+
+def load_node_analytics(store, path=ANALYTICS_FILE):
+    # Reuse the on-disk analytics while the source tables are unchanged
+    if os.path.exists(path):
+        try:
+            analytics = NodeAnalytics.load(path)
+            if analytics.version == store.version:
+                return analytics
+        except (OSError, ValueError, KeyError):
+            pass
+    analytics = NodeAnalytics.build(store.edges, store.genes, store.version, load_locus_index(store))
+    try:
+        analytics.save(path)
+    except OSError:
+        pass
+    return analytics
+
+
+@st.cache_resource(show_spinner=False)
+def live_node_analytics():
+    # No append path: IDF weights and genomic clusters change with every new
+    # row, so a reload always rebuilds (off the request path, on the poller)
+    return get_live_data().derive(load_node_analytics)
+
+
+def get_node_analytics():
+    return live_node_analytics().get()
@@ -0,0 +1,90 @@
+import urllib.parse
+import pandas as pd
+
+DATA_DIR = "data"
+GENOME_FILE = "Adineta_vaga.fna"
+ANNOTATION_FILE = "Adineta_vaga.sorted.gff.gz"
+EXTERNAL_LINKS = {
+    "Google": "https://www.google.com/search?q={}",
+    "NCBI": "https://www.ncbi.nlm.nih.gov/search/?term={}",
+    "UniProt": "https://www.uniprot.org/uniprotkb?query={}",
+    "PubMed": "https://pubmed.ncbi.nlm.nih.gov/?term={}",
+}
+
+
+# --- Shared by the detail/IGV pages and the static export ---
+def external_links(node):
+    encoded = urllib.parse.quote(node)
+    return {name: url.format(encoded) for name, url in EXTERNAL_LINKS.items()}
+
+
+def page_urls(nodes, base_url, page):
+    # Link column to a multipage route (e.g. "/Node_Details") for each node
+    nodes = pd.Series(nodes, dtype=object)
+    return f"{base_url}/{page}?node=" + nodes.map(urllib.parse.quote)
+
+
+def node_locus(store, node, locus_index=None):
+    # HGT candidates resolve through the locus index; other genes through the protein table
+    locus = locus_index.locus_string(node) if locus_index is not None else ""
+    return locus or store.gene_locus(node)
+
+
+def igv_options(base_url, locus=""):
+    # igv.js browser options (also a valid igv.js session) for the local genome
+    data_url = f"{base_url}/{DATA_DIR}" if base_url else DATA_DIR
+    options = {
+        "genome": {
+            "fastaURL": f"{data_url}/{GENOME_FILE}",
+            "indexURL": f"{data_url}/{GENOME_FILE}.fai",
+        },
+        "tracks": [
+            {
+                "name": "Annotations (GFF3)",
+                "url": f"{data_url}/{ANNOTATION_FILE}",
+                "indexURL": f"{data_url}/{ANNOTATION_FILE}.tbi",
+                "format": "gff3",
+                "displayMode": "EXPANDED",
+            }
+        ],
+    }
+    if locus:
+        options["locus"] = locus
+    return options
+
+
+def json_records(df):
+    # Rows as dicts of JSON-safe Python values (missing -> None)
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def detail_record(node, fields, locus, protein):
+    return {"node": node, "fields": fields, "locus": locus, "protein": protein,
+            "links": external_links(node)}
+
+
+def node_detail(store, node, locus_index=None):
+    """Everything the detail page shows for one node, as plain JSON data."""
+    row = store.node_row(node)
+    if row is None:
+        return None
+    protein = store.gene_match(node)
+    return detail_record(node, json_records(row.to_frame().T)[0], node_locus(store, node, locus_index),
+                         json_records(protein)[0] if len(protein) else None)
+
+
+def iter_node_details(store, locus_index=None):
+    # (node, detail) for every source, with the row and protein lookups done
+    # as two table-wide operations instead of one per node
+    first = store.edges.drop_duplicates("source")
+    nodes = first["source"].astype(str).tolist()
+    fields = json_records(first)
+    proteins = [None] * len(nodes)
+    if not store.genes.empty and "Locus tag" in store.genes.columns:
+        genes = store.genes.drop_duplicates("Locus tag")
+        genes = genes.set_index(genes["Locus tag"].astype(object)).reindex(nodes)
+        found = genes["Locus tag"].notna().to_numpy()
+        for i, record in zip(found.nonzero()[0].tolist(), json_records(genes[found])):
+            proteins[i] = record
+    for node, row, protein in zip(nodes, fields, proteins):
+        yield node, detail_record(node, row, node_locus(store, node, locus_index), protein)
@@ -0,0 +1,237 @@
+import hashlib
+import os
+import pandas as pd
+from pandas.api.types import union_categoricals
+from graph_builder import class_labels, class_summary
+from graph_model import ClassIndex
+from ingest import IngestedTable, read_ingested
+from table_cache import compact_dtypes, read_table
+
+DATA_FILE = "file.txt"
+DATA_DIR = "data"
+GENE_TABLE_FILE = os.path.join(DATA_DIR, "vaga_proteins.tsv")
+
+
+# --- Index helpers ---
+def build_index(values):
+    # Map each key to the position of its first row, so lookups match the
+    # old `df[df[col] == key].iloc[0]` behaviour.
+    keys = list(values)
+    return dict(zip(reversed(keys), range(len(keys) - 1, -1, -1)))
+
+
+def data_version(*paths):
+    # Cheap identity of the files a store was loaded from: mtime and size
+    parts = []
+    for path in paths:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        else:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def file_digest(path, chunk_size=1 << 20):
+    # Content hash, for artefacts that should survive a touch or a copy
+    return sha256_prefix(path, None, chunk_size).hexdigest()
+
+
+def sha256_prefix(path, size, chunk_size=1 << 20):
+    # SHA-256 state after the first `size` bytes (the whole file when None),
+    # so a grown file can be checked against the hash of its old content and
+    # the hash carried on over just the new bytes
+    digest = hashlib.sha256()
+    remaining = size
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            chunk = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return digest
+
+
+EDGE_CATEGORICAL = ["source", "target", "class"]
+
+
+def prepare_edge_table(df):
+    return compact_dtypes(df, categorical=EDGE_CATEGORICAL)
+
+
+def prepare_gene_table(df_genes):
+    df_genes.columns = [c.strip() for c in df_genes.columns]
+    return compact_dtypes(df_genes, categorical=["Accession", "Strand"],
+                          integer=["Begin", "End", "Length", "GeneID"])
+
+
+def append_rows(edges, rows):
+    # Concatenate keeping categorical columns categorical (sorted categories)
+    rows = rows[list(edges.columns)]
+    data = {}
+    for col in edges.columns:
+        if isinstance(edges[col].dtype, pd.CategoricalDtype):
+            data[col] = union_categoricals(
+                [edges[col].array, pd.Categorical(rows[col].astype(object))], sort_categories=True)
+        elif isinstance(edges[col].dtype, pd.ArrowDtype):
+            # Arrow strings from the store: the new rows become one more chunk
+            data[col] = pd.concat([edges[col], rows[col].astype(edges[col].dtype)], ignore_index=True)
+        else:
+            data[col] = pd.concat([edges[col], rows[col]], ignore_index=True)
+    return pd.DataFrame(data)
+
+
+def load_edge_store(path=DATA_FILE):
+    # Streamed into the interned on-disk store; a plain parse is the fallback
+    if not os.path.exists(path):
+        return IngestedTable(None, None, None)
+    table = read_ingested(path, categorical=EDGE_CATEGORICAL)
+    if table is None:
+        return IngestedTable(read_table(path, prepare_edge_table), None, None)
+    return table
+
+
+def load_edge_table(path=DATA_FILE):
+    return load_edge_store(path).edges
+
+
+def load_gene_table(path=GENE_TABLE_FILE):
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return read_table(path, prepare_gene_table)
+
+
+# --- Node store ---
+class NodeStore:
+    """HGT edge table plus protein table, indexed on `source` and `Locus tag`."""
+
+    def __init__(self, edges, genes, version="", node_index=None, class_stats=None, content_hash=None):
+        self.edges = edges
+        self.genes = genes
+        self.version = version
+        if node_index is None:
+            node_index = build_index(edges["source"]) if edges is not None else {}
+        self._node_index = node_index
+        self._class_stats = class_stats
+        if not genes.empty and "Locus tag" in genes.columns:
+            self._gene_index = build_index(genes["Locus tag"])
+        else:
+            self._gene_index = {}
+        self._sorted_nodes = None
+        self._gene_names = None
+        self._content_hash = content_hash
+        self._class_index = None
+
+    @property
+    def content_hash(self):
+        if self._content_hash is None:
+            if data_version(DATA_FILE) == self.version.split("|")[0] and os.path.exists(DATA_FILE):
+                self._content_hash = file_digest(DATA_FILE)
+            else:
+                # The file moved on since this store was loaded; its bytes are
+                # not this store's content, so fall back to the version stamp
+                self._content_hash = "version:" + self.version
+        return self._content_hash
+
+    def appended(self, rows, genes, version, content_hash=None):
+        # New store for this table plus `rows` (read from the end of the file):
+        # existing node positions and class counts are kept, not recomputed
+        edges = append_rows(self.edges, rows)
+        node_index = dict(self._node_index)
+        offset = len(self.edges)
+        for node, pos in build_index(rows["source"]).items():
+            node_index.setdefault(node, offset + pos)
+        class_stats = None
+        if self._class_stats is not None and "class" in rows.columns:
+            # Edges count per row; a node counts once, under its first row's class
+            edge_counts = class_labels(rows).value_counts()
+            new_nodes = rows[~rows["source"].isin(self._node_index).to_numpy()].drop_duplicates("source")
+            node_counts = class_labels(new_nodes).value_counts()
+            index = self._class_stats.index.union(edge_counts.index)
+            class_stats = self._class_stats.reindex(index, fill_value=0)
+            class_stats["edges"] += edge_counts.reindex(index, fill_value=0)
+            class_stats["nodes"] += node_counts.reindex(index, fill_value=0)
+        return NodeStore(edges, genes, version, node_index, class_stats, content_hash)
+
+    @property
+    def class_index(self):
+        # Class codes and per-class row slices, shared by every class filter
+        if self._class_index is None and self.edges is not None and "class" in self.edges.columns:
+            self._class_index = ClassIndex.from_values(self.edges["class"])
+        return self._class_index
+
+    @property
+    def node_index(self):
+        return self._node_index
+
+    @property
+    def class_stats(self):
+        # Distinct nodes and edges per class (from ingestion when available)
+        if self._class_stats is None and self.edges is not None:
+            self._class_stats = class_summary(self.edges)
+        return self._class_stats
+
+    # Edge table lookups
+    def has_node(self, node):
+        return node in self._node_index
+
+    def node_row(self, node):
+        pos = self._node_index.get(node)
+        if pos is None:
+            return None
+        return self.edges.iloc[pos]
+
+    def node_rows(self, nodes):
+        # First row of each known node, in the order given, from one positional take
+        positions = [self._node_index[n] for n in nodes if n in self._node_index]
+        return self.edges.iloc[positions]
+
+    @property
+    def sorted_nodes(self):
+        if self._sorted_nodes is None:
+            self._sorted_nodes = sorted(self._node_index)
+        return self._sorted_nodes
+
+    # Protein table lookups
+    def has_gene(self, locus_tag):
+        return locus_tag in self._gene_index
+
+    def gene_row(self, locus_tag):
+        pos = self._gene_index.get(locus_tag)
+        if pos is None:
+            return None
+        return self.genes.iloc[pos]
+
+    def gene_match(self, locus_tag):
+        # One-row DataFrame, for pages that display the raw protein record
+        pos = self._gene_index.get(locus_tag)
+        if pos is None:
+            return self.genes.iloc[0:0]
+        return self.genes.iloc[pos:pos + 1]
+
+    def gene_locus(self, locus_tag):
+        row = self.gene_row(locus_tag)
+        if row is None:
+            return ""
+        return f"{row['Accession']}:{int(row['Begin'])}-{int(row['End'])}"
+
+    @property
+    def gene_names(self):
+        if self._gene_names is None:
+            self._gene_names = sorted(k for k in self._gene_index if pd.notna(k))
+        return self._gene_names
+
+
+def load_node_store():
+    version = data_version(DATA_FILE, GENE_TABLE_FILE)
+    edges, node_index, class_stats = load_edge_store()
+    return NodeStore(edges, load_gene_table(), version, node_index, class_stats)
+
+
+def get_node_store():
+    # Shared by every page and session in the process; treat as read-only. The
+    # live watcher replaces it (never mutates it) when the data files change.
+    from live_reload import get_live_data
+    return get_live_data().store
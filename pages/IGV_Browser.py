@@ -1,60 +1,38 @@
 import streamlit as st
-import os
-import pandas as pd
-import threading
-import http.server
-import socketserver
-import socket
 import streamlit.components.v1 as components
 import urllib.parse
+import bisect
+import json
+from assets import IGV_CDN, get_asset_bundle
+from metrics import RerunTrace, debug_enabled, debug_panel
+from node_detail import igv_options, node_locus
+from node_store import get_node_store
+from file_server import get_file_server
+from locus_index import get_locus_index, live_locus_index
+from prefetch import get_prefetcher
 
 # ======================================================
 # ---------- CONFIG ------------------------------------
 # ======================================================
 st.set_page_config(page_title="IGV Browser — Adineta_vaga", layout="wide")
-DATA_DIR = "data"
+trace = RerunTrace("igv_browser")
 
 # ======================================================
 # ---------- FILE SERVER (with CORS) -------------------
 # ======================================================
-class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def end_headers(self):
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "x-requested-with, content-type")
-        return super().end_headers()
-
-def get_free_port():
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.bind(('', 0))
-    port = s.getsockname()[1]
-    s.close()
-    return port
-
-def start_file_server():
-    handler = CORSRequestHandler
-    os.chdir(".")
-    port = get_free_port()
-    socketserver.TCPServer.allow_reuse_address = True
-    httpd = socketserver.TCPServer(("", port), handler)
-    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
-    thread.start()
-    return httpd, port
-
-server, PORT = start_file_server()
+# Shared by every session; started on first use and stopped at process exit
+server = get_file_server()
+PORT = server.port
+# Vendored lib/igv/igv.min.js, served by Streamlit on the app's own origin
+igv_script = get_asset_bundle().url("igv_js") or IGV_CDN
 
 # ======================================================
 # ---------- LOAD GENE TABLE ----------------------------
 # ======================================================
-gene_table_path = os.path.join(DATA_DIR, "vaga_proteins.tsv")
-
-if os.path.exists(gene_table_path):
-    df_genes = pd.read_csv(gene_table_path, sep="\t")
-    df_genes.columns = [c.strip() for c in df_genes.columns]
-    gene_names = sorted(df_genes["Locus tag"].dropna().unique().tolist())
-else:
-    df_genes = pd.DataFrame()
-    gene_names = []
+with trace.span("load_data"):
+    store = get_node_store()
+    locus_index = get_locus_index()
+gene_names = store.gene_names
 
 # ======================================================
 # ---------- STREAMLIT UI ------------------------------
@@ -93,14 +71,13 @@ else:
 # Auto-select gene if node matches a locus tag
 auto_locus = ""
 if node_name:
-    # Try to find the gene in the protein table
-    match = df_genes[df_genes["Locus tag"] == node_name]
-    if not match.empty:
-        row = match.iloc[0]
-        chrom = str(row["Accession"])
-        start = int(row["Begin"])
-        end = int(row["End"])
-        auto_locus = f"{chrom}:{start}-{end}"
+    # HGT candidates resolve through the precomputed locus index; other genes
+    # fall back to the protein table
+    with trace.span("locus_resolution"):
+        # Prefetched detail record for graph nodes; other genes look up directly
+        detail = get_prefetcher().detail(store, node_name, live_locus_index())
+        auto_locus = detail["locus"] if detail else node_locus(store, node_name, locus_index)
+    if auto_locus:
         st.success(f"Auto-selected gene: **{node_name}** → `{auto_locus}`")
 
 col1, col2 = st.columns([1, 2])
@@ -108,23 +85,18 @@ col1, col2 = st.columns([1, 2])
 with col1:
     st.markdown("### 🔍 Search Region or Gene")
     gene_choice = st.selectbox("Select gene:", [""] + gene_names, 
-                              index=(gene_names.index(node_name) + 1 if node_name in gene_names else 0))
+                              index=(bisect.bisect_left(gene_names, node_name) + 1 if store.has_gene(node_name) else 0))
     manual_locus = st.text_input("Or enter locus manually (e.g. CP075492.1:20000-30000):", "")
 
 with col2:
     st.markdown("### ℹ️ Selected Gene Info")
 
     if gene_choice:
-        match = df_genes[df_genes["Locus tag"] == gene_choice]
+        with trace.span("gene_lookup"):
+            match = store.gene_match(gene_choice)
+            gene_locus = store.gene_locus(gene_choice) if not match.empty else ""
         if not match.empty:
-            row = match.iloc[0]
-            chrom = str(row["Accession"])
-            start = int(row["Begin"])
-            end = int(row["End"])
-            gene_locus = f"{chrom}:{start}-{end}"
             st.write(match)
-        else:
-            gene_locus = ""
     else:
         gene_locus = ""
 
@@ -145,29 +117,14 @@ igv_html = f"""
 <!DOCTYPE html>
 <html>
 <head>
-  <script src="https://cdn.jsdelivr.net/npm/igv@2.15.5/dist/igv.min.js"></script>
+  <script src="{igv_script}"></script>
 </head>
 <body>
   <div id="igv-container" style="height:{height}px; border:1px solid #ccc;"></div>
   <script>
     const container = document.getElementById("igv-container");
 
-    const options = {{
-      genome: {{
-        fastaURL: "http://localhost:{PORT}/{DATA_DIR}/Adineta_vaga.fna",
-        indexURL: "http://localhost:{PORT}/{DATA_DIR}/Adineta_vaga.fna.fai"
-      }},
-      locus: "{locus}" || undefined,
-      tracks: [
-        {{
-          name: "Annotations (GFF3)",
-          url: "http://localhost:{PORT}/{DATA_DIR}/Adineta_vaga.sorted.gff.gz",
-          indexURL: "http://localhost:{PORT}/{DATA_DIR}/Adineta_vaga.sorted.gff.gz.tbi",
-          format: "gff3",
-          displayMode: "EXPANDED"
-        }}
-      ]
-    }};
+    const options = {json.dumps(igv_options(f"http://localhost:{PORT}", locus))};
 
     igv.createBrowser(container, options).then(browser => {{
       console.log("✅ IGV loaded.");
@@ -180,4 +137,10 @@ igv_html = f"""
 </html>
 """
 
-components.html(igv_html, height=height + 80)
+trace.count("payload_bytes", len(igv_html.encode("utf-8")))
+with trace.span("components_html"):
+    components.html(igv_html, height=height + 80)
+
+trace.finish()
+if debug_enabled():
+    debug_panel(trace, server.metrics_url)
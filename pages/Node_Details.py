@@ -1,8 +1,14 @@
 import streamlit as st
 import pandas as pd
-import os
 import urllib.parse
 import streamlit.components.v1 as components  # ← ADD THIS IMPORT
+from metrics import RerunTrace, debug_enabled, debug_panel
+from locus_index import live_locus_index
+from node_analytics import NEIGHBOUR_WINDOW, live_node_analytics
+from node_detail import external_links, page_urls
+from node_store import get_node_store
+from prefetch import get_prefetcher
+from region_query import get_region_query
 
 # --- Setup ---
 st.set_page_config(page_title="Node_Details", layout="wide")
@@ -32,18 +38,13 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-# --- Load Data ---
-@st.cache_data
-def load_data():
-    path = "file.txt"
-    if os.path.exists(path):
-        return pd.read_csv(path, sep="\t")
-    else:
-        st.error("Data file 'file.txt' not found.")
-        return None
+trace = RerunTrace("node_details")
 
-df = load_data()
-if df is None:
+# --- Load Data ---
+with trace.span("load_data"):
+    store = get_node_store()
+if store.edges is None:
+    st.error("Data file 'file.txt' not found.")
     st.stop()
 
 # --- Get node name from URL ---
@@ -60,12 +61,12 @@ if not node_name:
     st.error("No node specified.")
     st.stop()
 
-if node_name not in df["source"].values:
+with trace.span("node_lookup"):
+    node_data = store.node_row(node_name)
+if node_data is None:
     st.error(f"Node '{node_name}' not found in data.")
     st.stop()
 
-node_data = df[df["source"] == node_name].iloc[0]
-
 # --- Header ---
 st.markdown(f"""
 <div class="node-header">
@@ -109,6 +110,33 @@ with tab1:
     # Embedded iframe for IGV
     components.iframe(full_igv_url, height=600, scrolling=True)
 
+    # Genomic context straight from the local .fai/tabix indexes
+    gene_locus = store.gene_locus(node_name)
+    region_query = get_region_query()
+    if gene_locus and region_query.available:
+        st.markdown("---")
+        st.markdown(f"**Genomic Context** `{gene_locus}`")
+        region = None
+        try:
+            with trace.span("region_query"):
+                region = region_query.query(gene_locus)
+        except ValueError as e:
+            # Malformed locus or a contig missing from the local indexes
+            st.warning(f"Genomic context unavailable for `{gene_locus}`: {e}")
+        if region is not None:
+            trace.count("payload_bytes", len(region.sequence or "") + sum(len(str(f)) for f in region.features))
+            if region.features:
+                features_df = pd.DataFrame(region.features)
+                features_df["attributes"] = [
+                    ";".join(f"{k}={v}" for k, v in attrs.items()) for attrs in features_df["attributes"]
+                ]
+                st.dataframe(features_df, hide_index=True, use_container_width=True)
+            else:
+                st.info("No annotated features overlap this locus.")
+            if region.sequence:
+                with st.expander(f"Sequence ({len(region.sequence):,} bp)"):
+                    st.code(region.sequence, language=None, wrap_lines=True)
+
 # --- Overview tab ---
 with tab2:
     st.subheader("Basic Information")
@@ -131,14 +159,7 @@ with tab3:
 # --- External Links tab ---
 with tab4:
     st.subheader("External Links")
-    encoded_node = urllib.parse.quote(node_name)
-    links = {
-        "Google": f"https://www.google.com/search?q={encoded_node}",
-        "NCBI": f"https://www.ncbi.nlm.nih.gov/search/?term={encoded_node}",
-        "UniProt": f"https://www.uniprot.org/uniprotkb?query={encoded_node}",
-        "PubMed": f"https://pubmed.ncbi.nlm.nih.gov/?term={encoded_node}"
-    }
-    for name, url in links.items():
+    for name, url in external_links(node_name).items():
         st.markdown(
             f'<a href="{url}" target="_blank" style="display:block;margin:6px 0;background-color:#008CBA;color:white;padding:10px;border-radius:5px;text-decoration:none;text-align:center;">{name}</a>',
             unsafe_allow_html=True
@@ -147,7 +168,65 @@ with tab4:
 # --- Analysis tab ---
 with tab5:
     st.subheader("Node Analysis")
-    st.write("Add advanced metrics or related nodes here.")
+    with trace.span("analytics"):
+        # Usually already cached by the main page's prefetch
+        detail = get_prefetcher().detail(store, node_name, live_locus_index(), live_node_analytics())
+        summary = detail["analytics"]
+    if summary is None:
+        st.info("No precomputed analytics for this node yet.")
+    else:
+        base_url = f"http://localhost:{st.get_option('server.port') or 8501}"
+        cluster = summary["cluster"]
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric(f"Other {summary['class']} nodes", f"{summary['same_class_count']:,}")
+        m2.metric(f"Candidates within {NEIGHBOUR_WINDOW // 1000} kb", f"{summary['neighbour_count']:,}")
+        m3.metric("HGT cluster size", cluster["size"] if cluster else "—")
+        m4.metric("Similar descriptions", len(summary["similar"]))
+
+        def related_table(nodes, **columns):
+            # Node, its class and description, any extra columns, and a detail link
+            rows = store.node_rows(nodes).reset_index(drop=True)
+            table = pd.DataFrame({"Node": rows["source"].astype(str)})
+            for name, values in columns.items():
+                table[name] = values
+            for col in ("class", "description"):
+                if col in rows.columns:
+                    table[col.capitalize()] = rows[col].astype(object).to_numpy()
+            table["Details"] = page_urls(table["Node"], base_url, "Node_Details").to_numpy()
+            st.dataframe(table, hide_index=True, use_container_width=True,
+                         column_config={"Details": st.column_config.LinkColumn("Details", display_text="📋 Open")})
+
+        st.markdown(f"**Genomic neighbours** (HGT candidates within {NEIGHBOUR_WINDOW:,} bp)")
+        if summary["neighbours"]:
+            nodes, gaps = zip(*summary["neighbours"])
+            related_table(list(nodes), **{"Distance (bp)": list(gaps)})
+            if summary["neighbour_count"] > len(summary["neighbours"]):
+                st.caption(f"Closest {len(summary['neighbours'])} shown.")
+        else:
+            st.caption("No other candidates nearby, or no coordinates for this node.")
+
+        st.markdown("**HGT cluster**")
+        if cluster:
+            st.caption(f"Cluster {cluster['id'] + 1}: {cluster['size']} candidates at `{cluster['locus']}`")
+            related_table([n for n in cluster["members"] if n != node_name])
+        else:
+            st.caption("Not part of a genomic cluster of candidates.")
+
+        st.markdown("**Similar descriptions** (TF-IDF cosine)")
+        if summary["similar"]:
+            nodes, scores = zip(*summary["similar"])
+            related_table(list(nodes), Similarity=[round(s, 3) for s in scores])
+        else:
+            st.caption("No other node shares distinctive description terms.")
+
+        with st.expander(f"Same-class nodes ({summary['same_class_count']:,})"):
+            related_table(summary["same_class"])
+            if summary["same_class_count"] > len(summary["same_class"]):
+                st.caption(f"First {len(summary['same_class'])} shown.")
 
 st.markdown("---")
 st.markdown(f"*Node detail page for: {node_name}*")
+
+trace.finish()
+if debug_enabled():
+    debug_panel(trace)
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from graph_builder import CLUSTER_COLORS, class_labels, contrast_font_colors, hex_to_int
+from live_reload import get_live_data
+
+SCHEMES = ("node", "class")
+_HEX = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+
+
+# --- Colour columns ---
+def int_to_hex(values):
+    # 0xRRGGBB integers -> "#RRGGBB" strings, one array operation for the lot
+    values = np.asarray(values, dtype=np.int64)
+    out = np.empty((len(values), 7), dtype=np.uint8)
+    out[:, 0] = ord("#")
+    out[:, 1:] = _HEX[(values[:, None] >> np.arange(20, -1, -4)) & 0xF]
+    return out.view("S7").ravel().astype(str)
+
+
+def node_hashes(nodes):
+    # pandas' hash is keyed with a fixed seed, so colours match across
+    # processes and restarts (unlike Python's salted hash())
+    return pd.util.hash_array(np.asarray(nodes, dtype=object))
+
+
+def hash_colors(nodes):
+    return int_to_hex((node_hashes(nodes) >> np.uint64(40)).astype(np.int64))
+
+
+def class_colors(nodes, labels, classes):
+    # One base colour per class (by position in `classes`), each node lightened
+    # or darkened a little by its hash so neighbours in a class stay distinguishable
+    codes = pd.Index(classes).get_indexer(np.asarray(labels, dtype=object))
+    base = hex_to_int(CLUSTER_COLORS)[codes % len(CLUSTER_COLORS)]
+    rgb = np.stack([(base >> 16) & 0xFF, (base >> 8) & 0xFF, base & 0xFF], axis=1).astype(float)
+    shade = 0.8 + 0.4 * (node_hashes(nodes) % np.uint64(1000)).astype(float) / 1000
+    rgb = np.clip(rgb * shade[:, None], 0, 255).astype(np.int64)
+    return int_to_hex((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2])
+
+
+# --- Palette ---
+class NodePalette:
+    """Fill and contrast font colour for every source node, computed once."""
+
+    def __init__(self, nodes, colors, scheme="node", classes=()):
+        self.scheme = scheme
+        self.classes = list(classes)
+        self.index = pd.Index(np.asarray(nodes, dtype=object))
+        self.colors = np.asarray(colors, dtype=str)
+        self.font_colors = contrast_font_colors(self.colors)
+
+    def __len__(self):
+        return len(self.index)
+
+    @classmethod
+    def build(cls, edges, scheme="node", classes=()):
+        if scheme not in SCHEMES:
+            raise ValueError(f"Unknown colour scheme: {scheme}")
+        if edges is None or edges.empty:
+            return cls([], [], scheme, classes)
+        first = edges.drop_duplicates("source")
+        nodes = first["source"].astype(object).to_numpy()
+        if scheme == "class":
+            # Classes keep their colour slot; new ones are appended in sorted order
+            labels = class_labels(first).to_numpy()
+            classes = list(classes) + sorted(set(labels) - set(classes))
+            colors = class_colors(nodes, labels, classes)
+        else:
+            colors = hash_colors(nodes)
+        return cls(nodes, colors, scheme, classes)
+
+    def extended(self, rows):
+        # Palette plus colours for the sources in `rows` it has not seen yet
+        first = rows.drop_duplicates("source")
+        first = first[self.index.get_indexer(first["source"].astype(object).to_numpy()) < 0]
+        if first.empty:
+            return self
+        added = NodePalette.build(first, self.scheme, self.classes)
+        return NodePalette(np.concatenate([self.index.to_numpy(), added.index.to_numpy()]),
+                           np.concatenate([self.colors, added.colors]), self.scheme, added.classes)
+
+    def styles(self, nodes):
+        # (fill colours, font colours) aligned with `nodes`; ids outside the
+        # table fall back to their hash colour
+        nodes = np.asarray(nodes, dtype=object)
+        pos = self.index.get_indexer(nodes)
+        colors = self.colors[pos]
+        fonts = self.font_colors[pos]
+        missing = pos < 0
+        if missing.any():
+            colors[missing] = hash_colors(nodes[missing])
+            fonts[missing] = contrast_font_colors(colors[missing])
+        return colors, fonts
+
+    def color(self, node):
+        return self.styles([node])[0][0]
+
+
+def extend_palette(palette, old, new, diff):
+    # Appended rows only add nodes; anything else rebuilds
+    return palette.extended(diff.added) if diff.appended else None
+
+
+@st.cache_resource(show_spinner=False)
+def live_palette(scheme="node"):
+    return get_live_data().derive(lambda store: NodePalette.build(store.edges, scheme), extend_palette)
+
+
+def get_palette(scheme="node"):
+    # One palette per scheme for the whole process, shared by every session
+    return live_palette(scheme).get()
@@ -0,0 +1,39 @@
+"""Precompute force-directed layouts offline, before the app is started.
+
+    python precompute_layouts.py [--classes Bacteria Fungi] [--each-class]
+
+Writes .cache/layouts/<key>.npz for the current file.txt, the same files the
+app looks up when the Force-directed layout is picked, so the first request
+for a precomputed filter is a file read instead of a spring embedding run.
+The unfiltered layout (also used by the incremental graph mode) is always
+computed; --classes adds one filter, --each-class one per single class.
+"""
+import argparse
+import time
+from graph_builder import compute_force_layout
+from node_store import DATA_FILE, load_node_store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute force-directed layouts for the HGT network.")
+    parser.add_argument("--classes", nargs="*", default=[], help="also lay out this class filter")
+    parser.add_argument("--each-class", action="store_true", help="also lay out every single-class filter")
+    args = parser.parse_args(argv)
+
+    store = load_node_store()
+    if store.edges is None:
+        raise SystemExit(f"Data file '{DATA_FILE}' not found.")
+    filters = [()]
+    if args.classes:
+        filters.append(tuple(args.classes))
+    if args.each_class and store.class_index is not None:
+        counts = store.class_index.counts()
+        filters.extend((c,) for c in counts.index[counts.to_numpy() > 0])
+    for classes in dict.fromkeys(filters):
+        start = time.perf_counter()
+        n_nodes = compute_force_layout(store.edges, store.content_hash, classes, store.class_index)
+        print(f"{', '.join(classes) or 'all classes':<30} {n_nodes:>9,} nodes  {time.perf_counter() - start:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
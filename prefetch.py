@@ -0,0 +1,91 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import streamlit as st
+from metrics import get_metrics
+from node_detail import node_detail
+from region_query import LRUCache
+
+PREFETCH_WORKERS = 2
+DETAIL_CACHE_SIZE = 2048
+logger = logging.getLogger(__name__)
+
+
+# --- Background warm-up for the detail and IGV pages ---
+class Prefetcher:
+    """Warms what the Node_Details and IGV_Browser pages need for a node
+    before the user opens them: its detail record (row, locus, protein,
+    analytics) in `details`, and the FASTA/GFF region and BGZF block caches
+    for its locus.
+
+    Work runs on a small thread pool so the main page never waits on it;
+    `locus_index` and `analytics` are live `Derived` values, resolved on the
+    worker thread.
+    """
+
+    def __init__(self, workers=PREFETCH_WORKERS, cache_size=DETAIL_CACHE_SIZE):
+        self.details = LRUCache(cache_size)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def prefetch(self, store, nodes, locus_index=None, analytics=None, region_query=None):
+        # Queue nodes not already cached or queued for this data version
+        futures = []
+        for node in nodes:
+            key = (store.version, node)
+            with self._lock:
+                if key in self._pending or key in self.details:
+                    continue
+                self._pending.add(key)
+            futures.append(self._executor.submit(self._warm, key, store, node, locus_index,
+                                                 analytics, region_query))
+        return futures
+
+    def _warm(self, key, store, node, locus_index, analytics, region_query):
+        try:
+            detail = self.detail(store, node, locus_index, analytics)
+            if detail is None or region_query is None or not region_query.available:
+                return
+            # The detail page queries the protein-table locus, the IGV page the
+            # locus index one; usually they are the same string
+            for locus in dict.fromkeys([store.gene_locus(node), detail["locus"]]):
+                if locus:
+                    try:
+                        region_query.query(locus)
+                    except ValueError:
+                        pass
+        except Exception:
+            logger.exception("Prefetching %r failed", node)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def detail(self, store, node, locus_index=None, analytics=None):
+        """Detail record for `node` (None if unknown), from the cache or built now.
+
+        The record is `node_detail`'s plus an "analytics" summary once an
+        `analytics` source has been given for it.
+        """
+        key = (store.version, node)
+        detail = self.details.get(key)
+        if detail is None:
+            detail = node_detail(store, node, locus_index.get() if locus_index is not None else None)
+            if detail is None:
+                return None
+            self.details.put(key, detail)
+        if analytics is not None and "analytics" not in detail:
+            # A new record, never a change to the one other threads may be reading
+            detail = {**detail, "analytics": analytics.get().node_summary(node)}
+            self.details.put(key, detail)
+        return detail
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_prefetcher():
+    prefetcher = Prefetcher()
+    get_metrics().register("detail_cache", prefetcher.details.stats)
+    return prefetcher
@@ -0,0 +1,326 @@
+import gzip
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import OrderedDict, namedtuple
+import streamlit as st
+from metrics import get_metrics
+from node_store import DATA_DIR
+
+FASTA_FILE = os.path.join(DATA_DIR, "Adineta_vaga.fna")
+GFF_FILE = os.path.join(DATA_DIR, "Adineta_vaga.sorted.gff.gz")
+
+BLOCK_CACHE_BYTES = 64 * 1024 * 1024
+REGION_CACHE_BYTES = 32 * 1024 * 1024
+# Rough in-memory size of one parsed GFF feature dict
+FEATURE_BYTES = 512
+
+Region = namedtuple("Region", ["chrom", "start", "end", "sequence", "features"])
+GFF_COLUMNS = ["seqid", "source", "type", "start", "end", "score", "strand", "phase", "attributes"]
+
+
+# --- Locus strings ---
+_LOCUS_RE = re.compile(r"^\s*([^:\s]+)(?::([\d,]+)(?:-([\d,]+))?)?\s*$")
+
+
+def parse_locus(locus):
+    # "CP075492.1:20000-30000" -> ("CP075492.1", 20000, 30000), 1-based inclusive.
+    # A bare contig name gives (chrom, 1, None); a single position gives (chrom, pos, pos).
+    m = _LOCUS_RE.match(locus or "")
+    if not m:
+        raise ValueError(f"Invalid locus: {locus!r}")
+    chrom, start, end = m.groups()
+    if start is None:
+        return chrom, 1, None
+    start = int(start.replace(",", ""))
+    end = int(end.replace(",", "")) if end else start
+    if start < 1 or end < start:
+        raise ValueError(f"Invalid locus: {locus!r}")
+    return chrom, start, end
+
+
+class LRUCache:
+    """Thread-safe LRU bounded by a total weight (bytes or item count)."""
+
+    def __init__(self, max_weight, weigh=lambda value: 1):
+        self.max_weight = max_weight
+        self._weigh = weigh
+        self._entries = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        weight = self._weigh(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._weight -= old[1]
+            self._entries[key] = (value, weight)
+            self._weight += weight
+            while self._weight > self.max_weight and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._weight -= evicted
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self), "weight": self._weight}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+
+# --- FASTA via .fai ---
+class FastaFile:
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index = {}
+        with open(index_path or path + ".fai") as fai:
+            for line in fai:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) >= 5:
+                    name, length, offset, linebases, linewidth = fields[:5]
+                    self.index[name] = (int(length), int(offset), int(linebases), int(linewidth))
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def length(self, chrom):
+        return self.index[chrom][0]
+
+    def fetch(self, chrom, start, end=None):
+        # 1-based inclusive coordinates, clipped to the contig
+        length, offset, linebases, linewidth = self.index[chrom]
+        start0 = max(start - 1, 0)
+        end0 = length if end is None else min(end, length)
+        if end0 <= start0:
+            return ""
+
+        def byte_at(pos):
+            return offset + (pos // linebases) * linewidth + pos % linebases
+
+        raw = self._mm[byte_at(start0):byte_at(end0 - 1) + 1]
+        return raw.translate(None, b"\r\n").decode("ascii")
+
+    def close(self):
+        self._mm.close()
+
+
+# --- BGZF blocks ---
+class BgzfFile:
+    def __init__(self, path, cache):
+        self.path = path
+        self._cache = cache
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def block(self, coffset):
+        # -> (decompressed data, offset of the next block)
+        key = (self.path, coffset)
+        block = self._cache.get(key)
+        if block is None:
+            mm = self._mm
+            if mm[coffset:coffset + 4] != b"\x1f\x8b\x08\x04":
+                raise ValueError(f"{self.path}: no BGZF block at offset {coffset}")
+            xlen = struct.unpack_from("<H", mm, coffset + 10)[0]
+            bsize = None
+            pos, extra_end = coffset + 12, coffset + 12 + xlen
+            while pos < extra_end:
+                si1, si2, slen = mm[pos], mm[pos + 1], struct.unpack_from("<H", mm, pos + 2)[0]
+                if si1 == 66 and si2 == 67:
+                    bsize = struct.unpack_from("<H", mm, pos + 4)[0]
+                pos += 4 + slen
+            if bsize is None:
+                raise ValueError(f"{self.path}: BGZF block at {coffset} has no BSIZE")
+            cdata = mm[extra_end:coffset + bsize + 1 - 8]
+            block = (zlib.decompress(cdata, -15), coffset + bsize + 1)
+            self._cache.put(key, block)
+        return block
+
+    def read(self, vbegin, vend):
+        # Bytes between two virtual offsets (coffset << 16 | uoffset)
+        coffset, uoffset = vbegin >> 16, vbegin & 0xFFFF
+        cend, uend = vend >> 16, vend & 0xFFFF
+        out = []
+        size = len(self._mm)
+        while coffset < size and coffset <= cend:
+            data, next_offset = self.block(coffset)
+            out.append(data[uoffset:uend] if coffset == cend else data[uoffset:])
+            coffset, uoffset = next_offset, 0
+        return b"".join(out)
+
+    def close(self):
+        self._mm.close()
+
+
+# --- Tabix index ---
+def reg2bins(beg, end):
+    # UCSC binning scheme used by tabix (0-based, end exclusive)
+    end -= 1
+    bins = [0]
+    for shift, offset in ((26, 1), (23, 9), (20, 73), (17, 585), (14, 4681)):
+        bins.extend(range(offset + (beg >> shift), offset + (end >> shift) + 1))
+    return bins
+
+
+class TabixIndex:
+    def __init__(self, path):
+        data = gzip.decompress(open(path, "rb").read())
+        if data[:4] != b"TBI\x01":
+            raise ValueError(f"{path} is not a tabix index")
+        n_ref, fmt, self.col_seq, self.col_beg, self.col_end, meta, self.skip, l_nm = \
+            struct.unpack_from("<8i", data, 4)
+        self.zero_based = bool(fmt & 0x10000)
+        self.meta = chr(meta)
+        pos = 36
+        names = data[pos:pos + l_nm].split(b"\x00")
+        pos += l_nm
+        self.refs = {}
+        for tid in range(n_ref):
+            n_bin = struct.unpack_from("<i", data, pos)[0]
+            pos += 4
+            bins = {}
+            for _ in range(n_bin):
+                bin_id, n_chunk = struct.unpack_from("<Ii", data, pos)
+                pos += 8
+                chunks = struct.unpack_from(f"<{2 * n_chunk}Q", data, pos)
+                pos += 16 * n_chunk
+                bins[bin_id] = list(zip(chunks[0::2], chunks[1::2]))
+            n_intv = struct.unpack_from("<i", data, pos)[0]
+            pos += 4
+            linear = struct.unpack_from(f"<{n_intv}Q", data, pos)
+            pos += 8 * n_intv
+            self.refs[names[tid].decode()] = (bins, linear)
+
+    def chunks(self, chrom, beg, end):
+        # Merged (vbegin, vend) chunks that may hold records overlapping [beg, end)
+        if chrom not in self.refs:
+            return []
+        bins, linear = self.refs[chrom]
+        min_offset = linear[min(beg >> 14, len(linear) - 1)] if linear else 0
+        found = sorted(
+            chunk for b in reg2bins(beg, end) for chunk in bins.get(b, ())
+            if chunk[1] > min_offset
+        )
+        merged = []
+        for cbeg, cend in found:
+            if merged and cbeg <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], cend))
+            else:
+                merged.append((cbeg, cend))
+        return merged
+
+
+class TabixFile:
+    def __init__(self, path, cache, index_path=None):
+        self.index = TabixIndex(index_path or path + ".tbi")
+        self.bgzf = BgzfFile(path, cache)
+
+    def fetch(self, chrom, start, end):
+        # Lines overlapping 1-based inclusive [start, end]
+        idx = self.index
+        beg0 = start - 1
+        lines = []
+        for vbeg, vend in idx.chunks(chrom, beg0, end):
+            for line in self.bgzf.read(vbeg, vend).decode().split("\n"):
+                if not line or line.startswith(idx.meta):
+                    continue
+                fields = line.split("\t")
+                if fields[idx.col_seq - 1] != chrom:
+                    continue
+                fbeg = int(fields[idx.col_beg - 1]) - (0 if idx.zero_based else 1)
+                fend = int(fields[idx.col_end - 1]) if idx.col_end else fbeg + 1
+                if fbeg < end and fend > beg0:
+                    lines.append(line)
+        return lines
+
+    def close(self):
+        self.bgzf.close()
+
+
+def parse_gff_line(line):
+    fields = line.split("\t")
+    feature = dict(zip(GFF_COLUMNS, fields))
+    feature["start"] = int(feature["start"])
+    feature["end"] = int(feature["end"])
+    feature["attributes"] = dict(
+        part.split("=", 1) for part in fields[8].strip().split(";") if "=" in part
+    ) if len(fields) > 8 else {}
+    return feature
+
+
+# --- Region queries ---
+def region_weight(region):
+    return len(region.sequence or "") + FEATURE_BYTES * len(region.features)
+
+
+class RegionQuery:
+    """Sequence slices and GFF3 features for a locus, from the local indexed files."""
+
+    def __init__(self, fasta_path=FASTA_FILE, gff_path=GFF_FILE,
+                 block_cache_bytes=BLOCK_CACHE_BYTES, region_cache_bytes=REGION_CACHE_BYTES):
+        self.block_cache = LRUCache(block_cache_bytes, weigh=lambda block: len(block[0]))
+        self.region_cache = LRUCache(region_cache_bytes, weigh=region_weight)
+        has_fasta = os.path.exists(fasta_path) and os.path.exists(fasta_path + ".fai")
+        has_gff = os.path.exists(gff_path) and os.path.exists(gff_path + ".tbi")
+        self.fasta = FastaFile(fasta_path) if has_fasta else None
+        self.gff = TabixFile(gff_path, self.block_cache) if has_gff else None
+
+    @property
+    def available(self):
+        return self.fasta is not None or self.gff is not None
+
+    def query(self, locus, with_sequence=True):
+        chrom, start, end = parse_locus(locus)
+        if end is None:
+            if self.fasta is None or chrom not in self.fasta.index:
+                raise ValueError(f"Contig length unknown for {chrom!r}")
+            end = self.fasta.length(chrom)
+        key = (chrom, start, end, with_sequence)
+        region = self.region_cache.get(key)
+        if region is None:
+            sequence = None
+            if with_sequence and self.fasta is not None and chrom in self.fasta.index:
+                sequence = self.fasta.fetch(chrom, start, end)
+            features = []
+            if self.gff is not None:
+                features = [parse_gff_line(line) for line in self.gff.fetch(chrom, start, end)]
+            region = Region(chrom, start, end, sequence, features)
+            # Whole contigs and other huge slices would flush everything else
+            if region_weight(region) <= self.region_cache.max_weight // 4:
+                self.region_cache.put(key, region)
+        return region
+
+    def close(self):
+        for handle in (self.fasta, self.gff):
+            if handle is not None:
+                handle.close()
+
+
+@st.cache_resource(show_spinner=False)
+def get_region_query():
+    query = RegionQuery()
+    metrics = get_metrics()
+    metrics.register("region_cache", query.region_cache.stats)
+    metrics.register("block_cache", query.block_cache.stats)
+    return query
@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+import streamlit as st
+from live_reload import get_live_data
+from metrics import get_metrics
+
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+# --- LRU cache of rendered graph HTML, bounded by total size ---
+class RenderCache:
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        return self._size
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, html):
+        nbytes = len(html.encode("utf-8"))
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (html, nbytes)
+            self._size += nbytes
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def get_or_render(self, key, render):
+        html = self.get(key)
+        if html is None:
+            # Rendering happens outside the lock; concurrent misses may both render
+            html = render()
+            self.put(key, html)
+        return html
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self), "bytes": self._size}
+
+    def evict(self, predicate):
+        # Drop every entry whose key matches, e.g. renders of an old data version
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._size -= self._entries.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def render_key(data_version, image_size, font_size, connection_width, selected_classes,
+               bg_color, highlight_nodes, *extra):
+    # Class and highlight order does not change the graph, so key on sets
+    return (data_version, image_size, font_size, connection_width,
+            frozenset(selected_classes), bg_color, frozenset(highlight_nodes)) + extra
+
+
+@st.cache_resource(show_spinner=False)
+def get_render_cache():
+    cache = RenderCache()
+    # Renders of a superseded data version can never be hit again
+    get_live_data().subscribe(lambda old, new, diff: cache.evict(lambda key: key[0] == old.version))
+    get_metrics().register("render_cache", cache.stats)
+    return cache
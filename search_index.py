@@ -0,0 +1,173 @@
+import re
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+import streamlit as st
+from graph_builder import UNCLASSIFIED
+from live_reload import get_live_data
+
+TOKEN_PATTERN = r"[0-9a-z]+(?:[._][0-9a-z]+)*"
+# Field -> weight; an ID hit outranks a class hit, which outranks free text
+EDGE_FIELDS = {"source": 4.0, "class": 2.0, "description": 1.0}
+GENE_FIELDS = {"Protein name": 1.0, "Protein product": 2.0, "Accession": 1.0, "GeneID": 2.0}
+
+SearchResult = namedtuple("SearchResult", "nodes scores total facets terms")
+
+
+def query_terms(query):
+    return list(dict.fromkeys(re.findall(TOKEN_PATTERN, str(query).lower())))
+
+
+def field_postings(values, weight):
+    # (doc, token, weight) triples for one text column, one doc per row
+    text = pd.Series(values, dtype=object)
+    text = text.where(text.notna(), "").astype(str).str.lower().reset_index(drop=True)
+    full = text.str.findall(TOKEN_PATTERN).explode().dropna()
+    parts = full[full.str.contains(r"[._]", regex=True)].str.split(r"[._]", regex=True).explode()
+    tokens = pd.concat([full, parts])
+    tokens = tokens[tokens != ""]
+    return pd.DataFrame({"doc": tokens.index.to_numpy(), "token": tokens.to_numpy(), "weight": weight})
+
+
+# --- Inverted index over HGT candidates ---
+class SearchIndex:
+    """Token -> node postings over the edge table (first row per source) and
+    the matching protein record, with per-class facets.
+
+    The vocabulary is sorted so a prefix maps to one contiguous range; postings
+    are CSR arrays (`indptr`, `docs`, `weights`) aligned with `vocab`.
+    """
+
+    def __init__(self, nodes, classes, doc_class, vocab, indptr, docs, weights):
+        self.nodes = nodes
+        self.classes = classes
+        self.doc_class = doc_class
+        self.vocab = vocab
+        self.indptr = indptr
+        self.docs = docs
+        self.weights = weights
+        doc_freq = np.diff(indptr)
+        self.idf = np.log1p(len(nodes) / np.maximum(doc_freq, 1))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @classmethod
+    def build(cls, edges, genes):
+        if edges is None or edges.empty:
+            return cls.empty()
+        first = edges.drop_duplicates("source")
+        nodes = first["source"].astype(str).to_numpy()
+        labels = first["class"].astype(object).fillna(UNCLASSIFIED) if "class" in first.columns \
+            else pd.Series(UNCLASSIFIED, index=first.index)
+        doc_class, classes = pd.factorize(labels.astype(str), sort=True)
+
+        postings = [field_postings(first[col].to_numpy(), w) for col, w in EDGE_FIELDS.items()
+                    if col in first.columns]
+        if not genes.empty and "Locus tag" in genes.columns:
+            gene_rows = genes.drop_duplicates("Locus tag").set_index("Locus tag")
+            # object dtype first, so a node without a protein record does not
+            # turn GeneID into floats ("123.0") for every other node
+            gene_rows = gene_rows[[col for col in GENE_FIELDS if col in gene_rows.columns]].astype(object)
+            gene_rows = gene_rows.reindex(first["source"].astype(object).to_numpy())
+            postings += [field_postings(gene_rows[col].to_numpy(), w) for col, w in GENE_FIELDS.items()
+                         if col in gene_rows.columns]
+        postings = pd.concat(postings, ignore_index=True)
+        # A token counts once per node, at its best field weight
+        postings = postings.groupby(["token", "doc"], sort=True)["weight"].max().reset_index()
+
+        vocab, token_codes = np.unique(postings["token"].to_numpy(dtype=str), return_inverse=True)
+        indptr = np.searchsorted(token_codes, np.arange(len(vocab) + 1))
+        return cls(nodes, np.asarray(classes, dtype=str), doc_class.astype(np.int32), vocab,
+                   indptr, postings["doc"].to_numpy(dtype=np.int64),
+                   postings["weight"].to_numpy(dtype=np.float32))
+
+    def extended(self, rows, genes):
+        # This index plus the sources first seen in `rows` (appended edge rows):
+        # only the new nodes are tokenized, then both posting lists are merged
+        fresh = rows[~rows["source"].astype(str).isin(self.nodes).to_numpy()]
+        added = SearchIndex.build(fresh, genes)
+        if not len(added):
+            return self
+        classes = np.union1d(self.classes, added.classes)
+        doc_class = np.concatenate([np.searchsorted(classes, self.classes)[self.doc_class],
+                                    np.searchsorted(classes, added.classes)[added.doc_class]])
+        tokens = np.concatenate([np.repeat(self.vocab, np.diff(self.indptr)),
+                                 np.repeat(added.vocab, np.diff(added.indptr))])
+        docs = np.concatenate([self.docs, added.docs + len(self.nodes)])
+        weights = np.concatenate([self.weights, added.weights])
+        vocab, token_codes = np.unique(tokens, return_inverse=True)
+        order = np.lexsort((docs, token_codes))
+        indptr = np.searchsorted(token_codes[order], np.arange(len(vocab) + 1))
+        return SearchIndex(np.concatenate([self.nodes, added.nodes]), classes, doc_class.astype(np.int32),
+                           vocab, indptr, docs[order], weights[order])
+
+    @classmethod
+    def empty(cls):
+        return cls(np.array([], dtype=str), np.array([], dtype=str), np.array([], dtype=np.int32),
+                   np.array([], dtype=str), np.zeros(1, dtype=np.int64),
+                   np.array([], dtype=np.int64), np.array([], dtype=np.float32))
+
+    # Term lookups
+    def term_range(self, term, prefix=False):
+        lo = np.searchsorted(self.vocab, term, side="left")
+        hi = np.searchsorted(self.vocab, term + "\uffff" if prefix else term, side="right")
+        return lo, hi
+
+    def expand(self, term, prefix=False):
+        lo, hi = self.term_range(term, prefix)
+        return self.vocab[lo:hi].tolist()
+
+    def term_scores(self, term, prefix=False):
+        # Best idf-weighted score of `term` (or any completion of it) per node
+        lo, hi = self.term_range(term, prefix)
+        scores = np.zeros(len(self.nodes), dtype=np.float32)
+        if hi > lo:
+            start, end = self.indptr[lo], self.indptr[hi]
+            token_idf = np.repeat(self.idf[lo:hi], np.diff(self.indptr[lo:hi + 1]))
+            np.maximum.at(scores, self.docs[start:end], self.weights[start:end] * token_idf)
+        return scores
+
+    # Queries
+    def search(self, query, k=50, classes=None, prefix=True):
+        """All query tokens must match (the last one as a prefix while typing,
+        or every one when `prefix` is True). Facets count every match; `classes`
+        then narrows the ranked top-k."""
+        terms = query_terms(query)
+        if not terms or not len(self.nodes):
+            return SearchResult([], [], 0, {}, [])
+        total = np.zeros(len(self.nodes), dtype=np.float32)
+        matched = np.ones(len(self.nodes), dtype=bool)
+        expanded = []
+        for i, term in enumerate(terms):
+            as_prefix = prefix or i == len(terms) - 1
+            scores = self.term_scores(term, as_prefix)
+            matched &= scores > 0
+            total += scores
+            expanded += self.expand(term, as_prefix)
+        hits = np.flatnonzero(matched)
+        counts = np.bincount(self.doc_class[hits], minlength=len(self.classes))
+        facets = {str(self.classes[c]): int(counts[c]) for c in np.flatnonzero(counts)}
+        if classes:
+            wanted = np.isin(self.classes, list(classes))
+            hits = hits[wanted[self.doc_class[hits]]]
+        if k is not None and len(hits) > k:
+            hits = hits[np.argpartition(-total[hits], k - 1)[:k]]
+        # Best score first, ties in table order
+        hits = hits[np.lexsort((hits, -total[hits]))]
+        return SearchResult(self.nodes[hits].tolist(), total[hits].tolist(), int(matched.sum()),
+                            facets, expanded)
+
+
+def extend_search_index(index, old, new, diff):
+    # Appended rows with an unchanged protein table only add nodes; anything else rebuilds
+    return index.extended(diff.added, new.genes) if diff.appended and new.genes is old.genes else None
+
+
+@st.cache_resource(show_spinner=False)
+def live_search_index():
+    return get_live_data().derive(lambda store: SearchIndex.build(store.edges, store.genes), extend_search_index)
+
+
+def get_search_index():
+    return live_search_index().get()
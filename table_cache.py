@@ -0,0 +1,87 @@
+import json
+import os
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow ships with streamlit; plain CSV parsing still works without it
+    pa = None
+
+CACHE_DIR = ".cache"
+CACHE_FORMAT = 1
+METADATA_KEY = b"hgt_source"
+
+
+# --- Typed columns ---
+def compact_dtypes(df, categorical=(), integer=()):
+    # Repeated IDs/labels become categoricals, coordinates the smallest safe int
+    df = df.copy()
+    for col in categorical:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col in integer:
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]) and df[col].notna().all():
+            values = df[col]
+            small = values.empty or (values.min() >= -2**31 and values.max() < 2**31)
+            df[col] = values.astype("int32" if small else "int64")
+    return df
+
+
+# --- Columnar cache ---
+def cache_path(path, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, os.path.basename(path) + ".feather")
+
+
+def source_signature(path):
+    stat = os.stat(path)
+    return json.dumps({
+        "path": os.path.abspath(path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "format": CACHE_FORMAT,
+    }, sort_keys=True).encode()
+
+
+def read_cache(cached, signature):
+    # Memory-mapped Arrow IPC; None when missing, unreadable or stale
+    if pa is None or not os.path.exists(cached):
+        return None
+    try:
+        with pa.memory_map(cached) as source:
+            reader = pa.ipc.open_file(source)
+            if (reader.schema.metadata or {}).get(METADATA_KEY) != signature:
+                return None
+            return reader.read_all().to_pandas()
+    except (OSError, pa.ArrowInvalid):
+        return None
+
+
+def write_cache(df, cached, signature):
+    if pa is None:
+        return
+    os.makedirs(os.path.dirname(cached) or ".", exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), METADATA_KEY: signature})
+    tmp = cached + ".tmp"
+    # Uncompressed so later reads can map the file instead of decoding it
+    feather.write_feather(table, tmp, compression="uncompressed")
+    os.replace(tmp, cached)
+
+
+def read_table(path, prepare=None, cache_dir=CACHE_DIR):
+    # TSV -> DataFrame, parsed once and then served from a columnar copy that is
+    # rebuilt whenever the TSV's mtime or size changes.
+    signature = source_signature(path)
+    cached = cache_path(path, cache_dir)
+    df = read_cache(cached, signature)
+    if df is not None:
+        return df
+    df = pd.read_csv(path, sep="\t")
+    if prepare is not None:
+        df = prepare(df)
+    try:
+        write_cache(df, cached, signature)
+    except OSError:
+        pass
+    return df
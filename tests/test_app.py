@@ -0,0 +1,53 @@
+import os
+import pytest
+from streamlit.testing.v1 import AppTest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = os.path.join(ROOT_DIR, "app26.py")
+
+pytestmark = pytest.mark.skipif(not os.path.exists(os.path.join(ROOT_DIR, "file.txt")),
+                                reason="needs file.txt")
+
+
+# --- Fixtures ---
+@pytest.fixture
+def app(monkeypatch):
+    # The app reads file.txt and data/ relative to the working directory
+    monkeypatch.chdir(ROOT_DIR)
+    return AppTest.from_file(APP_FILE, default_timeout=120).run()
+
+
+def by_label(elements, label):
+    return next(e for e in elements if e.label == label)
+
+
+# --- Node picks ---
+def test_picks_survive_class_filter_during_search(app):
+    by_label(app.sidebar.text_input, "Search nodes").input("protein").run()
+    pick = "I4U23_010823"
+    nodes = by_label(app.sidebar.multiselect, "Nodes")
+    assert pick in nodes.options
+    nodes.set_value([pick]).run()
+    assert app.session_state.picked_nodes == [pick]
+    before = by_label(app.sidebar.multiselect, "Nodes").options
+
+    # The class filter narrows the search hits, so the options change
+    app.sidebar.checkbox(key="class_Bacteria").check().run()
+    nodes = by_label(app.sidebar.multiselect, "Nodes")
+    assert nodes.options != before
+    assert nodes.value == [pick]
+    assert app.session_state.picked_nodes == [pick]
+
+    # Clearing the search keeps it too
+    by_label(app.sidebar.text_input, "Search nodes").input("").run()
+    assert by_label(app.sidebar.multiselect, "Nodes").value == [pick]
+    assert not app.exception
+
+
+def test_picks_survive_new_query(app):
+    nodes = by_label(app.sidebar.multiselect, "Nodes")
+    pick = nodes.options[0]
+    nodes.set_value([pick]).run()
+    by_label(app.sidebar.text_input, "Search nodes").input("protein").run()
+    assert by_label(app.sidebar.multiselect, "Nodes").value == [pick]
+    assert not app.exception
@@ -0,0 +1,114 @@
+import http.client
+import pytest
+from file_server import FileServer, parse_ranges
+from metrics import Metrics
+
+SIZE = 1000
+
+
+# --- Fixtures ---
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    root = tmp_path_factory.mktemp("served")
+    payload = bytes(i % 251 for i in range(SIZE))
+    (root / "data.bin").write_bytes(payload)
+    metrics = Metrics()
+    server = FileServer(root=str(root), host="127.0.0.1", metrics=metrics)
+    yield server, payload, metrics
+    server.shutdown()
+
+
+def request(server, method="GET", path="/data.bin", **headers):
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+    try:
+        conn.request(method, path, headers=headers)
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+# --- Byte ranges ---
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", [(0, 99)]),
+    ("bytes=900-2000", [(900, 999)]),
+    ("bytes=-100", [(900, 999)]),
+    ("bytes=-5000", [(0, 999)]),
+    ("bytes=500-", [(500, 999)]),
+    ("bytes=0-9,20-29,-10", [(0, 9), (20, 29), (990, 999)]),
+    ("bytes= 0-0 , 5-", [(0, 0), (5, 999)]),
+    ("bytes=1000-", []),
+    ("bytes=1000-1100,2000-", []),
+    ("bytes=-0", []),
+    ("bytes=5000-,0-4", [(0, 4)]),
+])
+def test_parse_ranges(header, expected):
+    assert parse_ranges(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["items=0-9", "bytes=", "bytes=9-0", "bytes=a-b", "bytes=10", "0-9"])
+def test_parse_ranges_ignores_invalid(header):
+    assert parse_ranges(header, 1000) is None
+
+
+def test_parse_ranges_empty_file():
+    assert parse_ranges("bytes=0-", 0) == []
+    assert parse_ranges("bytes=-10", 0) == []
+
+
+# --- Served responses ---
+def test_whole_file(server):
+    server, payload, _ = server
+    status, headers, body = request(server)
+    assert status == 200
+    assert body == payload
+    assert headers["Accept-Ranges"] == "bytes"
+    assert headers["Access-Control-Allow-Origin"] == "*"
+
+
+def test_single_range(server):
+    server, payload, _ = server
+    status, headers, body = request(server, Range="bytes=100-199")
+    assert status == 206
+    assert headers["Content-Range"] == f"bytes 100-199/{SIZE}"
+    assert headers["Content-Length"] == "100"
+    assert body == payload[100:200]
+    # HEAD: same headers, no body
+    status, headers, body = request(server, "HEAD", Range="bytes=-10")
+    assert (status, headers["Content-Length"], body) == (206, "10", b"")
+
+
+def test_multiple_ranges(server):
+    server, payload, _ = server
+    status, headers, body = request(server, Range="bytes=0-9,500-509")
+    assert status == 206
+    ctype, _, boundary = headers["Content-Type"].partition("; boundary=")
+    assert ctype == "multipart/byteranges"
+    assert int(headers["Content-Length"]) == len(body)
+    parts = body.split(f"--{boundary}".encode())
+    assert parts[0] == b"" and parts[-1] == b"--\r\n"
+    for part, (start, end) in zip(parts[1:-1], [(0, 9), (500, 509)]):
+        head, _, data = part.partition(b"\r\n\r\n")
+        assert f"Content-Range: bytes {start}-{end}/{SIZE}".encode() in head
+        assert data == payload[start:end + 1] + b"\r\n"
+
+
+def test_unsatisfiable_range(server):
+    server, _, _ = server
+    status, headers, body = request(server, Range=f"bytes={SIZE}-")
+    assert status == 416
+    assert headers["Content-Range"] == f"bytes */{SIZE}"
+    assert body == b""
+
+
+def test_missing_file_and_metrics(server):
+    server, _, metrics = server
+    status, _, _ = request(server, path="/missing.bin")
+    assert status == 404
+    status, _, _ = request(server, Range="bytes=0-0")
+    assert status == 206
+    status, headers, body = request(server, path="/metrics")
+    assert status == 200
+    assert headers["Content-Type"].startswith("text/plain")
+    assert b'hgt_file_server_requests_total{status="206"}' in body
+    assert b'hgt_file_server_requests_total{status="404"}' in body
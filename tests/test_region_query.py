@@ -0,0 +1,204 @@
+import random
+import struct
+import zlib
+import pytest
+from region_query import BgzfFile, FastaFile, LRUCache, RegionQuery, TabixFile, parse_locus
+
+CONTIGS = {"CP075492.1": 2_345, "CP075493.1": 777}
+LINE_WIDTH = 60
+
+
+# --- Fixtures ---
+def random_sequence(length, seed):
+    rng = random.Random(seed)
+    return "".join(rng.choice("ACGT") for _ in range(length))
+
+
+@pytest.fixture(scope="module")
+def fasta(tmp_path_factory):
+    # FASTA wrapped at LINE_WIDTH plus a hand-written .fai
+    path = tmp_path_factory.mktemp("fasta") / "genome.fna"
+    sequences = {name: random_sequence(length, i) for i, (name, length) in enumerate(CONTIGS.items())}
+    fai = []
+    with open(path, "wb") as f:
+        for name, seq in sequences.items():
+            f.write(f">{name} test contig\n".encode())
+            fai.append(f"{name}\t{len(seq)}\t{f.tell()}\t{LINE_WIDTH}\t{LINE_WIDTH + 1}\n")
+            for i in range(0, len(seq), LINE_WIDTH):
+                f.write(seq[i:i + LINE_WIDTH].encode() + b"\n")
+    (path.parent / "genome.fna.fai").write_text("".join(fai))
+    return str(path), sequences
+
+
+def bgzf_block(data):
+    # One BGZF member: gzip header with the BC extra subfield holding BSIZE - 1
+    deflate = zlib.compressobj(6, zlib.DEFLATED, -15)
+    cdata = deflate.compress(data) + deflate.flush()
+    bsize = 18 + len(cdata) + 8
+    header = b"\x1f\x8b\x08\x04" + b"\x00" * 4 + b"\x00\xff" + struct.pack("<HBBHH", 6, 66, 67, 2, bsize - 1)
+    return header + cdata + struct.pack("<II", zlib.crc32(data), len(data))
+
+
+def gff_lines(seed=0):
+    # Sorted GFF3 genes, some overlapping, enough to span several BGZF blocks
+    rng = random.Random(seed)
+    lines = []
+    for name, length in CONTIGS.items():
+        starts = sorted(rng.randint(1, length) for _ in range(3_000))
+        for i, start in enumerate(starts):
+            end = min(start + rng.randint(0, 400), length)
+            lines.append(f"{name}\ttest\tgene\t{start}\t{end}\t.\t+\t.\tID=gene-{name}-{i};Name=g{i}")
+    return lines
+
+
+@pytest.fixture(scope="module")
+def gff(tmp_path_factory):
+    pysam = pytest.importorskip("pysam")
+    path = tmp_path_factory.mktemp("gff") / "genes.gff"
+    lines = gff_lines()
+    path.write_text("##gff-version 3\n" + "\n".join(lines) + "\n")
+    compressed = pysam.tabix_index(str(path), preset="gff", keep_original=True)
+    return compressed, lines
+
+
+def overlapping(lines, chrom, start, end):
+    # Brute-force reference: GFF lines on `chrom` overlapping 1-based [start, end]
+    hits = []
+    for line in lines:
+        fields = line.split("\t")
+        if fields[0] == chrom and int(fields[3]) <= end and int(fields[4]) >= start:
+            hits.append(line)
+    return hits
+
+
+# --- Locus strings ---
+@pytest.mark.parametrize("locus, expected", [
+    ("CP075492.1:200-300", ("CP075492.1", 200, 300)),
+    ("CP075492.1:1,000-2,000", ("CP075492.1", 1000, 2000)),
+    ("CP075492.1:150", ("CP075492.1", 150, 150)),
+    ("CP075492.1", ("CP075492.1", 1, None)),
+])
+def test_parse_locus(locus, expected):
+    assert parse_locus(locus) == expected
+
+
+@pytest.mark.parametrize("locus", ["", "CP075492.1:300-200", "CP075492.1:0-10", "CP075492.1:a-b", "chr 1:1-2"])
+def test_parse_locus_rejects_malformed(locus):
+    with pytest.raises(ValueError):
+        parse_locus(locus)
+
+
+# --- FASTA via .fai ---
+def test_fasta_fetch_matches_sequence(fasta):
+    path, sequences = fasta
+    handle = FastaFile(path)
+    try:
+        rng = random.Random(1)
+        for name, seq in sequences.items():
+            assert handle.length(name) == len(seq)
+            for _ in range(200):
+                start = rng.randint(1, len(seq))
+                end = rng.randint(start, len(seq))
+                assert handle.fetch(name, start, end) == seq[start - 1:end]
+            # Line boundaries, whole contig and a range running past the end
+            assert handle.fetch(name, LINE_WIDTH, LINE_WIDTH + 1) == seq[LINE_WIDTH - 1:LINE_WIDTH + 1]
+            assert handle.fetch(name, 1) == seq
+            assert handle.fetch(name, len(seq) - 5, len(seq) + 100) == seq[-6:]
+    finally:
+        handle.close()
+
+
+# --- BGZF blocks ---
+def test_bgzf_read_spans_blocks(tmp_path):
+    chunks = [bytes(random_sequence(1_000 + 37 * i, i), "ascii") for i in range(5)]
+    path = tmp_path / "data.bgz"
+    offsets = []
+    with open(path, "wb") as f:
+        for chunk in chunks:
+            offsets.append(f.tell())
+            f.write(bgzf_block(chunk))
+        f.write(bgzf_block(b""))  # EOF marker block
+    cache = LRUCache(1 << 20, weigh=lambda block: len(block[0]))
+    handle = BgzfFile(str(path), cache)
+    try:
+        data = b"".join(chunks)
+        assert handle.block(offsets[2]) == (chunks[2], offsets[3])
+        # Virtual offsets: from inside block 1 to inside block 3
+        vbegin, vend = offsets[1] << 16 | 10, offsets[3] << 16 | 20
+        assert handle.read(vbegin, vend) == data[len(chunks[0]) + 10:sum(map(len, chunks[:3])) + 20]
+        assert handle.read(offsets[4] << 16 | 5, offsets[4] << 16 | 5) == b""
+        assert cache.hits > 0
+        with pytest.raises(ValueError):
+            handle.block(offsets[1] + 1)
+    finally:
+        handle.close()
+
+
+# --- Tabix index ---
+def test_tabix_fetch_matches_brute_force(gff):
+    path, lines = gff
+    cache = LRUCache(1 << 24, weigh=lambda block: len(block[0]))
+    handle = TabixFile(path, cache)
+    try:
+        # The fixture is meant to cover chunks in more than one block
+        assert len({vbeg >> 16 for bins, _ in handle.index.refs.values()
+                    for chunks in bins.values() for vbeg, _ in chunks}) > 1
+        rng = random.Random(2)
+        for name, length in CONTIGS.items():
+            for _ in range(100):
+                start = rng.randint(1, length)
+                end = min(start + rng.randint(0, 600), length)
+                assert handle.fetch(name, start, end) == overlapping(lines, name, start, end)
+            assert handle.fetch(name, 1, length) == overlapping(lines, name, 1, length)
+        assert handle.fetch("missing.1", 1, 100) == []
+    finally:
+        handle.close()
+
+
+# --- Region queries ---
+def test_region_query(fasta, gff):
+    fasta_path, sequences = fasta
+    gff_path, lines = gff
+    query = RegionQuery(fasta_path, gff_path)
+    try:
+        assert query.available
+        region = query.query("CP075492.1:1,000-1,200")
+        assert region.sequence == sequences["CP075492.1"][999:1200]
+        assert [f["attributes"]["ID"] for f in region.features] == [
+            line.split("ID=")[1].split(";")[0] for line in overlapping(lines, "CP075492.1", 1000, 1200)
+        ]
+        assert query.query("CP075492.1:1,000-1,200") is region
+        # A bare contig spans it end to end
+        whole = query.query("CP075493.1", with_sequence=False)
+        assert (whole.start, whole.end, whole.sequence) == (1, CONTIGS["CP075493.1"], None)
+        with pytest.raises(ValueError):
+            query.query("CP075492.1:500-100")
+        with pytest.raises(ValueError):
+            query.query("unknown.1")
+    finally:
+        query.close()
+
+
+def test_region_cache_is_bounded_by_size(fasta, gff):
+    fasta_path, sequences = fasta
+    gff_path, _ = gff
+    query = RegionQuery(fasta_path, gff_path, region_cache_bytes=4_000_000)
+    try:
+        small = query.query("CP075492.1:100-120")
+        assert query.query("CP075492.1:100-120") is small
+        # A whole contig is over a quarter of the budget: served, not cached
+        whole = query.query("CP075492.1")
+        assert whole.sequence == sequences["CP075492.1"]
+        assert query.query("CP075492.1") is not whole
+        for i in range(100):
+            query.query(f"CP075493.1:{i + 1}-{i + 100}")
+        stats = query.region_cache.stats()
+        assert 0 < stats["entries"] < 100 and stats["weight"] <= 4_000_000
+    finally:
+        query.close()
+
+
+def test_region_query_without_files(tmp_path):
+    query = RegionQuery(str(tmp_path / "none.fna"), str(tmp_path / "none.gff.gz"))
+    assert not query.available
+